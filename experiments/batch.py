@@ -0,0 +1,30 @@
+"""Performance comparison of the batch solver and a loop over min_circle_cvx.
+
+This module times min_circle_batch on many small groups of points against
+solving the same groups one by one with min_circle_cvx.
+"""
+
+import time
+
+import numpy as np
+
+from cvx.ball.batch import min_circle_batch
+from cvx.ball.solver import min_circle_cvx
+
+if __name__ == "__main__":
+    # Generate 10000 groups of 5 to 20 random points in 2-dimensional space
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(5, 20, size=10000)
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    points = rng.standard_normal((offsets[-1], 2))
+
+    # Measure the batch solver
+    start = time.time()
+    radii, centers = min_circle_batch(points, offsets)
+    print(f"Batch solver: {time.time() - start:.4f} seconds")
+
+    # Measure a Python loop over min_circle_cvx
+    start = time.time()
+    for g in range(sizes.size):
+        min_circle_cvx(points[offsets[g] : offsets[g + 1]], solver="CLARABEL")
+    print(f"Loop over min_circle_cvx: {time.time() - start:.4f} seconds")
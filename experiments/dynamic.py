@@ -0,0 +1,48 @@
+"""Performance comparison of the dynamic ball and naive recomputation.
+
+This module times DynamicBall on a mixed stream of insertions and deletions
+against recomputing the ball of the current points from scratch with min_circle_cvx.
+"""
+
+import statistics
+import time
+
+import numpy as np
+
+from cvx.ball.dynamic import DynamicBall
+from cvx.ball.solver import min_circle_cvx
+
+if __name__ == "__main__":
+    # Start from 5000 random points in 3-dimensional space
+    rng = np.random.default_rng(0)
+    ball = DynamicBall()
+    handles = [ball.insert(point) for point in rng.standard_normal((5000, 3))]
+
+    # Measure a stream of 20000 operations, half of them deletions of random points
+    times_insert, times_delete = [], []
+    for _ in range(20000):
+        if rng.random() < 0.5:
+            start = time.perf_counter()
+            handles.append(ball.insert(rng.standard_normal(3)))
+            times_insert.append(time.perf_counter() - start)
+        else:
+            handle = handles.pop(rng.integers(len(handles)))
+            start = time.perf_counter()
+            ball.delete(handle)
+            times_delete.append(time.perf_counter() - start)
+
+    print("Dynamic ball, time per insertion:")
+    print(f"Mean: {statistics.mean(times_insert):.6f} seconds")
+    print(f"Max: {max(times_insert):.6f} seconds")
+    print("Dynamic ball, time per deletion:")
+    print(f"Mean: {statistics.mean(times_delete):.6f} seconds")
+    print(f"Max: {max(times_delete):.6f} seconds")
+
+    # Measure naive recomputation on a sample of operations
+    times_naive = []
+    for _ in range(20):
+        start = time.perf_counter()
+        min_circle_cvx(ball.points, solver="CLARABEL")
+        times_naive.append(time.perf_counter() - start)
+    print("\nNaive recomputation with min_circle_cvx, time per operation:")
+    print(f"Mean: {statistics.mean(times_naive):.6f} seconds")
@@ -0,0 +1,47 @@
+"""Performance comparison of the sliding-window ball and naive recomputation.
+
+This module times SlidingWindowBall.push on a stream of points in random order
+and on a drifting stream, the worst case of the structure, against recomputing
+the ball of every window from scratch with min_circle_cvx.
+"""
+
+import statistics
+import time
+
+import numpy as np
+
+from cvx.ball.solver import min_circle_cvx
+from cvx.ball.window import SlidingWindowBall
+
+if __name__ == "__main__":
+    window = 1000
+    rng = np.random.default_rng(0)
+
+    # 20000 random points in 3-dimensional space, in random order and with a trend,
+    # where the oldest point of the window is almost always a support point
+    streams = {
+        "iid": rng.standard_normal((20000, 3)),
+        "drifting": rng.standard_normal((20000, 3)) + np.linspace(0.0, 20000.0, 20000)[:, None],
+    }
+
+    for name, stream in streams.items():
+        # Measure the sliding-window structure on every tick
+        ball = SlidingWindowBall(window)
+        times_window = []
+        for point in stream:
+            start = time.perf_counter()
+            ball.push(point)
+            times_window.append(time.perf_counter() - start)
+        print(f"Sliding window ({name}), time per tick:")
+        print(f"Mean: {statistics.mean(times_window):.6f} seconds")
+        print(f"Max: {max(times_window):.6f} seconds")
+
+    # Measure naive recomputation on a sample of ticks
+    stream = streams["iid"]
+    times_naive = []
+    for tick in range(window, window + 100):
+        start = time.perf_counter()
+        min_circle_cvx(stream[tick - window : tick], solver="CLARABEL")
+        times_naive.append(time.perf_counter() - start)
+    print("\nNaive recomputation with min_circle_cvx, time per tick:")
+    print(f"Mean: {statistics.mean(times_naive):.6f} seconds")
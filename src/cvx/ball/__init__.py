@@ -3,6 +3,10 @@
 This package provides functionality for computing the smallest enclosing ball
 (minimum enclosing circle) for a set of points using convex optimization.
 
-The package includes a solver module for the core computation and a server
-module that provides a network interface to the solver.
+The package includes a solver module for the core computation, a batch module
+for many small problems at once, a parallel module spreading them across
+processes, stream, window and dynamic modules for incrementally changing point
+sets, a chunked module for point sets that do not fit into memory, a summary
+module for sharded point sets and a server module that provides a network
+interface to the solver.
 """
@@ -0,0 +1,179 @@
+"""Batch module for the CVX Ball package.
+
+This module computes the smallest enclosing balls of many groups of points
+in a single call. The groups are passed in a ragged, CSR-like layout: one
+concatenated array of points and an array of offsets into it.
+"""
+
+from itertools import combinations
+from typing import Any
+
+import numpy as np
+
+from .solver import _REL_TOL, WELZL_MAX_DIM, min_circle_clarabel
+
+
+def _subsets(m: int, d: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Enumerate the candidate boundary sets of a ball through at most d + 1 of m points.
+
+    Args:
+        m: The number of candidate points.
+        d: The dimension.
+
+    Returns:
+        For each subset size k = 1, ..., min(m, d + 1), a tuple of the subsets as an
+        array of shape (s_k, k) and the same subsets padded to d + 1 columns by
+        repeating their first point.
+    """
+    result = []
+    for k in range(1, min(m, d + 1) + 1):
+        subsets = np.array(list(combinations(range(m), k)), dtype=np.int64)
+        padded = np.concatenate([subsets, np.repeat(subsets[:, :1], d + 1 - k, axis=1)], axis=1)
+        result.append((subsets, padded))
+    return result
+
+
+def _small_meb(candidates: np.ndarray, subsets: list[tuple[np.ndarray, np.ndarray]]) -> tuple:
+    """Compute the exact minimum enclosing balls of many small point sets at once.
+
+    The minimum enclosing ball of m points is the smallest of the balls centered
+    at the circumcenters of its subsets of at most d + 1 points that contain all
+    m points. For every subset the circumcenter is computed with a batched
+    solve of its Gram system, and the radius is taken as the largest
+    distance to all m points. Every such ball encloses the candidates, and the
+    subset of support points attains the optimum, so the minimum is exact even
+    for duplicate or affinely dependent points.
+
+    Args:
+        candidates: A numpy array of shape (a, m, d) holding a sets of m points.
+        subsets: The output of _subsets(m, d).
+
+    Returns:
+        A tuple (centers of shape (a, d), squared radii of shape (a,),
+        positions of the support points of shape (a, d + 1)).
+    """
+    a, _, d = candidates.shape
+    best_r2 = np.full(a, np.inf)
+    best_center = np.zeros((a, d))
+    best_support = np.zeros((a, d + 1), dtype=np.int64)
+
+    for subset, padded in subsets:
+        # boundary points of all subsets of this size, shape (a, s, k, d)
+        boundary = candidates[:, subset, :]
+        origin = boundary[:, :, 0, :]
+        center = origin
+        if subset.shape[1] > 1:
+            v = boundary[:, :, 1:, :] - origin[:, :, None, :]
+            gram = v @ np.swapaxes(v, -1, -2)
+            rhs = 0.5 * np.einsum("asij,asij->asi", v, v)
+
+            # a tiny ridge keeps degenerate subsets solvable, their radius is checked below
+            ridge = 1e-12 * np.trace(gram, axis1=-2, axis2=-1) + np.finfo(float).tiny
+            gram += ridge[..., None, None] * np.eye(gram.shape[-1])
+            lam = np.linalg.solve(gram, rhs[..., None])[..., 0]
+            center = origin + np.einsum("asi,asij->asj", lam, v)
+
+        # radius of the ball around the circumcenter enclosing all candidates
+        u = candidates[:, None, :, :] - center[:, :, None, :]
+        r2 = np.einsum("asmj,asmj->asm", u, u).max(axis=2)
+
+        k = np.argmin(r2, axis=1)
+        r2 = r2[np.arange(a), k]
+        better = r2 < best_r2
+        best_r2[better] = r2[better]
+        best_center[better] = center[np.arange(a), k][better]
+        best_support[better] = padded[k][better]
+
+    return best_center, best_r2, best_support
+
+
+def min_circle_batch(
+    points: np.ndarray, offsets: np.ndarray, max_iter: int = 1000, **kwargs: dict[str, Any]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the smallest enclosing balls of many groups of points.
+
+    Group g consists of the points points[offsets[g]:offsets[g + 1]]. For
+    d <= WELZL_MAX_DIM all groups are solved together with the pivoting scheme of
+    min_circle_welzl: each iteration finds the farthest point of every group in a
+    single vectorized pass over all points, and updates the balls of all groups
+    with a violating point at once by solving the small problems on their support
+    set plus that point exactly. Larger dimensions are solved group by group with
+    min_circle_clarabel.
+
+    Args:
+        points: A numpy array of shape (N, d) with the points of all groups.
+        offsets: An integer array of shape (G + 1,) with offsets[0] = 0 and
+                offsets[G] = N delimiting the groups.
+        max_iter: Upper bound on the number of pivoting steps.
+        **kwargs: Settings of the Clarabel solver used for d > WELZL_MAX_DIM.
+
+    Returns:
+        A tuple containing:
+            - The radii of the smallest enclosing balls (numpy array of shape (G,))
+            - The center points of the balls (numpy array of shape (G, d))
+
+    Raises:
+        ValueError: If the offsets do not delimit non-empty groups of the points.
+    """
+    points = np.asarray(points, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    sizes = np.diff(offsets)
+
+    if offsets[0] != 0 or offsets[-1] != points.shape[0]:
+        raise ValueError("Offsets do not match the points")
+    if np.any(sizes <= 0):
+        raise ValueError("Group has no points")
+
+    n_groups = sizes.size
+    d = points.shape[1]
+    if n_groups == 0:
+        return np.zeros(0), np.zeros((0, d))
+
+    if d > WELZL_MAX_DIM:
+        radii, centers = np.zeros(n_groups), np.zeros((n_groups, d))
+        for g in range(n_groups):
+            radii[g], centers[g] = min_circle_clarabel(points[offsets[g] : offsets[g + 1]], **kwargs)
+        return radii, centers
+
+    group = np.repeat(np.arange(n_groups), sizes)
+    starts = offsets[:-1]
+
+    scale = float(np.ptp(points, axis=0).max(initial=0.0))
+    abs_tol = (1e-12 * scale) ** 2
+    subsets = _subsets(d + 2, d)
+
+    # Start with the ball of radius zero around the first point of each group
+    support = np.repeat(starts[:, None], d + 1, axis=1)
+    centers = points[starts].copy()
+    r2 = np.zeros(n_groups)
+    active = np.ones(n_groups, dtype=bool)
+
+    for _ in range(max_iter):
+        # farthest point of every group in one pass
+        u = points - centers[group]
+        d2 = np.einsum("ij,ij->i", u, u)
+        d2max = np.maximum.reduceat(d2, starts)
+
+        active &= d2max > r2 * (1.0 + _REL_TOL) + abs_tol
+        if not active.any():
+            break
+
+        hits = np.flatnonzero(d2 == d2max[group])
+        owner, first = np.unique(group[hits], return_index=True)
+        farthest = np.zeros(n_groups, dtype=np.int64)
+        farthest[owner] = hits[first]
+
+        # exact balls of support plus pivot for all groups with a violator
+        g = np.flatnonzero(active)
+        candidates = np.concatenate([support[g], farthest[g, None]], axis=1)
+        new_centers, new_r2, positions = _small_meb(points[candidates], subsets)
+
+        # groups without progress in floating point arithmetic are finished
+        progress = new_r2 > r2[g]
+        active[g[~progress]] = False
+        g, candidates = g[progress], candidates[progress]
+        centers[g] = new_centers[progress]
+        r2[g] = new_r2[progress]
+        support[g] = np.take_along_axis(candidates, positions[progress], axis=1)
+
+    return np.sqrt(r2), centers
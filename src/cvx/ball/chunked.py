@@ -0,0 +1,116 @@
+"""Out-of-core module for the CVX Ball package.
+
+This module computes the smallest enclosing ball of point sets that do not fit
+into memory. The points are read from memory-mapped .npy files or Arrow IPC
+files in chunks of bounded size, and only a small core set is ever materialized.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+
+from .solver import _CHUNK_SIZE, min_circle_coreset
+
+
+class _ArrowPoints:
+    """Read-only, row-indexable view of the points stored in an Arrow IPC file.
+
+    Every column of the file holds one coordinate. The file is memory-mapped and
+    record batches are converted to numpy arrays only when rows are requested.
+
+    Attributes:
+        shape: The shape (n, d) of the points.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open the file.
+
+        Args:
+            path: The path of the Arrow IPC file.
+        """
+        self._reader = pa.ipc.open_file(pa.memory_map(str(path)))
+        sizes = [self._reader.get_batch(i).num_rows for i in range(self._reader.num_record_batches)]
+        self._offsets = np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)])
+        self.shape = (int(self._offsets[-1]), len(self._reader.schema))
+
+    def _batch(self, i: int, offset: int = 0, length: int | None = None) -> np.ndarray:
+        """Convert (a slice of) a record batch to an array of shape (rows, d)."""
+        batch = self._reader.get_batch(i).slice(offset, length)
+        return np.column_stack([column.to_numpy(zero_copy_only=False) for column in batch.columns]).astype(float)
+
+    def __getitem__(self, key: int | slice | np.ndarray) -> np.ndarray:
+        """Get a row, a contiguous range of rows or rows by index.
+
+        Args:
+            key: A row index, a slice with unit step or an array of row indices.
+
+        Returns:
+            The requested rows.
+        """
+        if isinstance(key, slice):
+            start, stop, _ = key.indices(self.shape[0])
+            first = int(np.searchsorted(self._offsets, start, side="right")) - 1
+            last = int(np.searchsorted(self._offsets, stop, side="left"))
+
+            # convert only the rows of each batch within [start, stop)
+            rows = [np.zeros((0, self.shape[1]))]
+            for i in range(first, last):
+                lo = max(start, int(self._offsets[i])) - int(self._offsets[i])
+                hi = min(stop, int(self._offsets[i + 1])) - int(self._offsets[i])
+                rows.append(self._batch(i, lo, hi - lo))
+            return np.concatenate(rows)
+
+        index = np.asarray(key)
+        batches = np.searchsorted(self._offsets, index, side="right") - 1
+        rows = [
+            self._batch(int(b), int(i - self._offsets[b]), 1)
+            for i, b in zip(index.ravel(), batches.ravel(), strict=True)
+        ]
+        return np.concatenate(rows).reshape(*index.shape, self.shape[1])
+
+
+def min_circle_chunked(
+    source: str | Path | np.ndarray,
+    eps: float = 0.0,
+    chunk_size: int = _CHUNK_SIZE,
+    **kwargs: dict[str, Any],
+) -> tuple[float, np.ndarray]:
+    """Compute the smallest enclosing ball of points that may not fit into memory.
+
+    The points are processed with the core-set algorithm of min_circle_coreset:
+    chunked farthest-point passes over the source select a core set, and only the
+    core set is solved exactly. Peak memory is O(chunk_size + core set) regardless
+    of the number of points. The returned radius is the largest distance of any
+    point to the returned center, measured in a final pass, so the ball is verified
+    to enclose all points.
+
+    Args:
+        source: A path to a .npy file or an Arrow IPC file (.arrow, .feather),
+               whose columns are the coordinates, or an array such as np.memmap.
+        eps: The relative accuracy of the radius, 0 computes the exact ball up
+            to the solver tolerance.
+        chunk_size: Number of rows processed at once.
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver,
+                 used for core-set solves with d > WELZL_MAX_DIM.
+
+    Returns:
+        A tuple containing:
+            - The radius of the smallest enclosing ball (float)
+            - The center point of the ball (numpy array of shape (d,))
+
+    Raises:
+        ValueError: If the source has no points or the file type is not supported.
+    """
+    if isinstance(source, str | Path):
+        path = Path(source)
+        if path.suffix == ".npy":
+            source = np.load(path, mmap_mode="r")
+        elif path.suffix in (".arrow", ".feather", ".ipc"):
+            source = _ArrowPoints(path)
+        else:
+            raise ValueError(f"Unsupported file type: {path.suffix}")
+
+    radius, center, _ = min_circle_coreset(source, eps=eps, chunk_size=chunk_size, **kwargs)
+    return radius, center
@@ -0,0 +1,135 @@
+"""Dynamic module for the CVX Ball package.
+
+This module maintains the exact minimum enclosing ball of a set of points that
+supports insertions and deletions. The support points of the ball are tracked,
+so only changes that involve them trigger a recomputation.
+"""
+
+import numpy as np
+
+from .solver import _REL_TOL, _pivot_welzl
+
+
+class DynamicBall:
+    """Minimum enclosing ball of a set of points with insertions and deletions.
+
+    The points are kept contiguously in a growable buffer. A deletion moves the
+    last point into the freed row, so deleting a point that is not a support point
+    costs O(d) and leaves the ball unchanged. Inserting a point inside the ball
+    costs O(d) as well.
+
+    Deleting a support point or inserting a point outside the ball recomputes
+    the ball with the pivoting scheme of min_circle_welzl, warm started from the
+    remaining support points (and the new point). Each pivoting step is a single
+    vectorized pass over the points. For points in random order, a deletion hits
+    a support point with probability at most (d + 1) / n.
+
+    Points are identified by the handles returned by insert.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty set of points."""
+        self._buffer: np.ndarray | None = None
+        self._size = 0
+        self._handles = np.zeros(0, dtype=np.int64)
+        self._rows: dict[int, int] = {}
+        self._next = 0
+        self._support: list[int] = []
+        self._center: np.ndarray | None = None
+        self._r2 = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return self._size
+
+    def __contains__(self, handle: int) -> bool:
+        """Return whether a handle refers to a current point."""
+        return handle in self._rows
+
+    @property
+    def points(self) -> np.ndarray:
+        """Get the current points, in no particular order."""
+        return self._buffer[: self._size]
+
+    @property
+    def radius(self) -> float:
+        """Get the radius of the minimum enclosing ball."""
+        return float(np.sqrt(self._r2))
+
+    @property
+    def midpoint(self) -> np.ndarray | None:
+        """Get the center of the ball, None if there are no points."""
+        return self._center
+
+    @property
+    def support(self) -> np.ndarray:
+        """Get the support points of the ball, an array of shape (k, d)."""
+        return self._buffer[self._support]
+
+    def insert(self, point: np.ndarray) -> int:
+        """Add a point.
+
+        Args:
+            point: A numpy array of shape (d,).
+
+        Returns:
+            The handle of the point, used to delete it.
+        """
+        point = np.asarray(point, dtype=float)
+        if self._buffer is None:
+            self._buffer = np.zeros((16, point.size))
+            self._handles = np.zeros(16, dtype=np.int64)
+        elif self._size == self._buffer.shape[0]:
+            # double the capacity
+            self._buffer = np.concatenate([self._buffer, np.zeros_like(self._buffer)])
+            self._handles = np.concatenate([self._handles, np.zeros_like(self._handles)])
+
+        row, handle = self._size, self._next
+        self._buffer[row] = point
+        self._handles[row] = handle
+        self._rows[handle] = row
+        self._size += 1
+        self._next += 1
+
+        if self._center is not None:
+            u = point - self._center
+            if u @ u <= self._r2 * (1.0 + _REL_TOL):
+                # the new point is inside
+                return handle
+
+        # the new point lies on the boundary of the new ball, warm start from it
+        self._solve([row, *self._support])
+        return handle
+
+    def delete(self, handle: int) -> None:
+        """Remove a point.
+
+        Args:
+            handle: The handle returned by insert.
+
+        Raises:
+            KeyError: If the handle does not refer to a current point.
+        """
+        row = self._rows.pop(handle)
+        last = self._size - 1
+        removed = row in self._support
+        support = [j for j in self._support if j != row]
+
+        # move the last point into the freed row
+        if row != last:
+            self._buffer[row] = self._buffer[last]
+            self._handles[row] = self._handles[last]
+            self._rows[int(self._handles[row])] = row
+            support = [row if j == last else j for j in support]
+        self._size -= 1
+        self._support = support
+
+        if self._size == 0:
+            self._support, self._center, self._r2 = [], None, 0.0
+        elif removed:
+            # warm start from the remaining support points
+            self._solve(support)
+
+    def _solve(self, warm: list[int]) -> None:
+        """Recompute the ball with the pivoting scheme, warm started from the given rows."""
+        self._center, self._r2, self._support = _pivot_welzl(self.points, support=warm)
@@ -0,0 +1,129 @@
+"""Parallel module for the CVX Ball package.
+
+This module spreads independent minimum enclosing ball problems across a pool
+of worker processes. The points are copied once into a shared memory block that
+all workers map, so only offsets and results are pickled between processes.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from .batch import min_circle_batch
+
+# State of a worker process: the attached shared memory, the points and solver options
+_worker: dict[str, Any] = {}
+
+
+def _attach(name: str, shape: tuple[int, int], dtype: str, kwargs: dict[str, Any]) -> None:
+    """Attach a worker process to the shared memory block holding the points.
+
+    Args:
+        name: The name of the shared memory block.
+        shape: The shape of the points array.
+        dtype: The dtype of the points array.
+        kwargs: Keyword arguments passed on to min_circle_batch.
+    """
+    # Workers share the resource tracker of the parent, which owns and unlinks the block
+    shm = SharedMemory(name=name)
+    _worker["shm"] = shm
+    _worker["points"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _worker["kwargs"] = kwargs
+
+
+def _solve(offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Solve a contiguous range of groups in a worker process.
+
+    Args:
+        offsets: The offsets of the groups into the shared points.
+
+    Returns:
+        The radii and centers of the groups.
+    """
+    lo, hi = offsets[0], offsets[-1]
+    return min_circle_batch(_worker["points"][lo:hi], offsets - lo, **_worker["kwargs"])
+
+
+def _partition(offsets: np.ndarray, n_tasks: int) -> list[np.ndarray]:
+    """Split the groups into contiguous ranges with roughly equal numbers of points.
+
+    Args:
+        offsets: The offsets of all groups.
+        n_tasks: The desired number of ranges.
+
+    Returns:
+        The offsets of each range of groups, in input order.
+    """
+    n_groups = offsets.size - 1
+    targets = np.linspace(0, offsets[-1], n_tasks + 1)
+    bounds = np.unique(np.concatenate([[0], np.searchsorted(offsets, targets[1:-1]), [n_groups]]))
+    return [offsets[lo : hi + 1] for lo, hi in zip(bounds[:-1], bounds[1:], strict=True)]
+
+
+def min_circle_parallel(
+    points: np.ndarray,
+    offsets: np.ndarray,
+    workers: int | None = None,
+    tasks_per_worker: int = 4,
+    **kwargs: dict[str, Any],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the smallest enclosing balls of many groups of points on a process pool.
+
+    The groups are laid out as for min_circle_batch. They are split into contiguous
+    ranges with roughly equal numbers of points, and each worker solves its ranges
+    with min_circle_batch on a view of the shared points. A single large group is
+    solved by one worker; pass several groups to use several cores.
+
+    Args:
+        points: A numpy array of shape (N, d) with the points of all groups.
+        offsets: An integer array of shape (G + 1,) delimiting the groups.
+        workers: The number of worker processes, defaults to the number of CPUs.
+        tasks_per_worker: The number of ranges per worker, more ranges balance
+                         the load better at the cost of more scheduling overhead.
+        **kwargs: Additional keyword arguments to pass to min_circle_batch.
+
+    Returns:
+        A tuple containing:
+            - The radii of the smallest enclosing balls (numpy array of shape (G,))
+            - The center points of the balls (numpy array of shape (G, d))
+
+    Raises:
+        ValueError: If the offsets do not delimit non-empty groups of the points.
+    """
+    points = np.ascontiguousarray(points, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    if offsets[0] != 0 or offsets[-1] != points.shape[0]:
+        raise ValueError("Offsets do not match the points")
+    if np.any(np.diff(offsets) <= 0):
+        raise ValueError("Group has no points")
+
+    workers = workers or os.cpu_count() or 1
+    tasks = _partition(offsets, workers * tasks_per_worker)
+
+    # Copy the points once into shared memory, workers map it without pickling
+    shm = SharedMemory(create=True, size=max(points.nbytes, 1))
+    try:
+        shared = np.ndarray(points.shape, dtype=points.dtype, buffer=shm.buf)
+        shared[:] = points
+
+        # forking a process with running threads can deadlock, so the workers are spawned
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_attach,
+            initargs=(shm.name, points.shape, points.dtype.str, kwargs),
+        ) as pool:
+            # map returns the results in input order
+            results = list(pool.map(_solve, tasks))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    radii = np.concatenate([radius for radius, _ in results])
+    centers = np.concatenate([center for _, center in results])
+    return radii, centers
@@ -4,10 +4,133 @@ This module provides a server implementation that computes the smallest enclosin
 for a set of points using convex optimization.
 """
 
+import hashlib
+import json
+import multiprocessing
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
 import numpy as np
+import pyarrow as pa
+import pyarrow.flight as fl
 from flight import Server
+from flight.utils.alter import np_2_pa
+
+from .batch import min_circle_batch
+from .solver import WELZL_MAX_DIM, min_circle_anytime, min_circle_cvx, min_circle_welzl, support_indices
+from .stream import CoresetBall, EnclosingBall
+
+# Commands "batch" and "batch/<name>" carry many groups of points in one table
+BATCH_COMMAND = "batch"
+
+# Commands "stream" and "stream/<name>" carry points that are solved while they arrive
+STREAM_COMMAND = "stream"
+
+# Column of batch tables holding the group of each point
+GROUP_COLUMN = "group"
+
+
+def _is_command(command: str, name: str) -> bool:
+    """Check whether a command is named name or name/<suffix>."""
+    return command == name or command.startswith(f"{name}/")
+
+
+class ResultCache:
+    """LRU cache of responses keyed by the content of the request.
+
+    The key is a BLAKE2b digest of the bytes, shape and dtype of the points and
+    of the solver options, so resubmitted point sets are recognized regardless
+    of where they come from. Entries are evicted in least recently used order
+    once the arrays of all cached responses exceed the memory budget.
+
+    Attributes:
+        max_bytes: The memory budget for cached responses in bytes.
+        hits: The number of lookups that found a response.
+        misses: The number of lookups that found none.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: The memory budget for cached responses in bytes.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._results: OrderedDict[bytes, tuple[dict[str, np.ndarray], int]] = OrderedDict()
+        self._lock = threading.Lock()
 
-from .solver import min_circle_cvx
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._results)
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset the counters."""
+        with self._lock:
+            self._results.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+    @staticmethod
+    def key(matrix: np.ndarray, **options: Any) -> bytes:
+        """Compute the key of a request.
+
+        Args:
+            matrix: The points of the request.
+            **options: The solver options of the request.
+
+        Returns:
+            The digest of the points and options.
+        """
+        matrix = np.ascontiguousarray(matrix)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((matrix.shape, matrix.dtype.str, sorted(options.items()))).encode())
+        digest.update(memoryview(matrix).cast("B"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> dict[str, np.ndarray] | None:
+        """Look up a response.
+
+        Args:
+            key: The key of the request.
+
+        Returns:
+            The cached response, or None.
+        """
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._results.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: bytes, result: dict[str, np.ndarray]) -> None:
+        """Add a response, evicting the least recently used ones beyond the memory budget.
+
+        Responses larger than the budget are not cached.
+
+        Args:
+            key: The key of the request.
+            result: The response.
+        """
+        size = sum(np.asarray(value).nbytes for value in result.values())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._results:
+                self.nbytes -= self._results.pop(key)[1]
+            self._results[key] = (result, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._results.popitem(last=False)
+                self.nbytes -= evicted
 
 
 class BallServer(Server):
@@ -15,21 +138,104 @@ class BallServer(Server):
 
     This server extends the flight.Server class and implements the computation
     of the smallest enclosing ball for a set of points using convex optimization.
+
+    With a time budget, requests are answered with min_circle_anytime within the
+    budget, and the response reports a lower bound next to the radius.
+
+    Responses are cached by the content of the request, so resubmitted point
+    sets are answered without solving again.
+
+    Commands named "batch" or "batch/<name>" carry many groups of points in a
+    stream of record batches, with a "group" column and one column per coordinate.
+    They are answered with one row per group holding the radius and the center,
+    and solved together with min_circle_batch.
+
+    Commands named "stream" or "stream/<name>" carry points with one column per
+    coordinate. Each record batch updates a CoresetBall on the pool as it
+    arrives, so only the core set is kept in memory, and the ball is final as
+    soon as the upload is closed. The response holds a radius around the
+    midpoint that encloses all points, a lower bound for the optimal radius,
+    the achieved accuracy eps = radius / lower - 1 and the number of points.
+    The core set targets stream_eps, but with a limited number of directions
+    the achieved accuracy is worse from dimension 5 on. Above WELZL_MAX_DIM,
+    where the core set would be too large, an EnclosingBall is used instead,
+    whose radius encloses all points without any guarantee on eps.
+
+    Solves run on a dedicated pool of worker threads or processes, so the RPC
+    handler threads stay free for other calls such as the "health" action. At
+    most workers + queue_size solves are admitted at a time; further requests
+    are rejected with FlightUnavailableError until a solve finishes.
+
+    Attributes:
+        time_budget: The default wall-clock budget per request in seconds, or None
+                    to always compute the exact ball.
+        stream_eps: The requested accuracy of the balls of stream commands.
+        cache: The cache of responses.
+        workers: The number of concurrent solves.
+        queue_size: The number of admitted solves waiting for a worker.
     """
 
+    def __init__(
+        self,
+        *args: Any,
+        time_budget: float | None = None,
+        cache_bytes: int = 64 * 2**20,
+        workers: int = 4,
+        queue_size: int = 16,
+        processes: bool = False,
+        stream_eps: float = 1e-2,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            *args: Positional arguments passed to flight.Server.
+            time_budget: The default wall-clock budget per request in seconds.
+            cache_bytes: The memory budget of the response cache in bytes, 0 disables it.
+            workers: The number of concurrent solves.
+            queue_size: The number of admitted solves waiting for a worker.
+            processes: Whether to solve in worker processes instead of threads,
+                      which avoids contention on the GIL at the cost of copying the points.
+            stream_eps: The requested accuracy of the balls of stream commands.
+            **kwargs: Keyword arguments passed to flight.Server.
+        """
+        super().__init__(*args, **kwargs)
+        self.time_budget = time_budget
+        self.stream_eps = stream_eps
+        self.cache = ResultCache(cache_bytes)
+        self.workers = workers
+        self.queue_size = queue_size
+
+        # forking a process with running gRPC threads can deadlock, so worker processes are spawned
+        self._pool: Executor = (
+            ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            if processes
+            else ThreadPoolExecutor(max_workers=workers)
+        )
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._pending = 0
+        self._rejected = 0
+        self._counter_lock = threading.Lock()
+
     def f(self, matrices: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
         """Compute the smallest enclosing ball for a set of points.
 
         Args:
             matrices: A dictionary containing input matrices. Expected to have
                      an 'input' key with a numpy array of shape (n, d) where n
-                     is the number of points and d is the dimension.
+                     is the number of points and d is the dimension. An optional
+                     'time_budget' key overrides the time budget of the server,
+                     and a true 'lean' key leaves the points out of the response.
 
         Returns:
             A dictionary containing:
-                - 'radius': The radius of the smallest enclosing ball
+                - 'radius': The radius of the smallest enclosing ball, with a
+                  time budget the exact enclosing radius of the midpoint
                 - 'midpoint': The center point of the ball
-                - 'points': The original input points
+                - 'points': The original input points, unless lean
+                - 'support': If lean, the indices of the points on the boundary
+                - 'support_points': If lean, the points on the boundary
+                - 'lower': With a time budget, a lower bound for the optimal radius
 
         Raises:
             ValueError: If the input matrix is empty (has no points)
@@ -43,12 +249,291 @@ class BallServer(Server):
 
         self.logger.info(f"Matrix: {matrix}")
 
+        time_budget = matrices.get("time_budget", self.time_budget)
+        time_budget = None if time_budget is None else float(time_budget)
+        lean = bool(matrices.get("lean", False))
+
+        # identical requests are answered from the cache
+        key = self.cache.key(matrix, time_budget=time_budget, lean=lean)
+        result = self.cache.get(key)
+        if result is not None:
+            self.logger.info("Returning cached result")
+            return result
+
         # Compute the smallest enclosing ball using the solver
         self.logger.info("Computing smallest enclosing ball...")
-        radius, midpoint = min_circle_cvx(matrix, solver="CLARABEL")
+        result = self._submit(type(self)._solve, matrix, time_budget, lean).result()
+        self.cache.put(key, result)
+        return result
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Admit a solve to the pool, rejecting it if the queue is full.
+
+        Args:
+            fn: The function computing the response, picklable for worker processes.
+            *args: The arguments of fn.
+
+        Returns:
+            The future of the response.
+
+        Raises:
+            FlightUnavailableError: If workers + queue_size solves are already admitted.
+        """
+        self._admit()
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            self._done(None)
+            raise
+        future.add_done_callback(self._done)
+        return future
+
+    def _admit(self) -> None:
+        """Take a slot for a solve.
+
+        Raises:
+            FlightUnavailableError: If workers + queue_size solves are already admitted.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._counter_lock:
+                self._rejected += 1
+            raise fl.FlightUnavailableError("Server is busy, too many pending solves")
+
+        with self._counter_lock:
+            self._pending += 1
+
+    def _done(self, _: Future | None) -> None:
+        """Release the slot of a finished solve."""
+        with self._counter_lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def do_put(
+        self,
+        context: fl.ServerCallContext,
+        descriptor: fl.FlightDescriptor,
+        reader: fl.MetadataRecordBatchReader,
+        writer: fl.FlightMetadataWriter,
+    ) -> fl.FlightDescriptor:
+        """Handle a PUT request, solving stream commands while the record batches arrive.
+
+        Args:
+            context: The request context.
+            descriptor: The descriptor containing the command.
+            reader: Reader for the record batches sent by the client.
+            writer: Writer for metadata responses.
+
+        Returns:
+            A descriptor confirming the upload.
+
+        Raises:
+            ValueError: If a stream contains no points.
+        """
+        command = descriptor.command.decode("utf-8")
+        if not _is_command(command, STREAM_COMMAND):
+            return super().do_put(context, descriptor, reader, writer)
+
+        self.logger.info(f"Processing streaming PUT request for command: {command}")
+        ball: CoresetBall | EnclosingBall | None = None
+
+        # the stream holds one slot, its updates run on the pool one batch at a time
+        self._admit()
+        try:
+            for chunk in reader:
+                if chunk.data.num_rows == 0:
+                    continue
+                matrix = np.column_stack([column.to_numpy(zero_copy_only=False) for column in chunk.data.columns])
+                if ball is None:
+                    ball = type(self)._stream_ball(matrix.shape[1], self.stream_eps)
+                ball = self._pool.submit(type(self)._update, ball, matrix).result()
+
+            if ball is None:
+                raise ValueError("Matrix has no values")
+            result = self._pool.submit(type(self)._finalize, ball).result()
+        finally:
+            self._done(None)
+
+        with self._lock:
+            self._storage[command] = np_2_pa(result)
+        self.logger.info(f"Ball finalized for command: {command}")
+
+        return fl.FlightDescriptor.for_command(command)
+
+    @staticmethod
+    def _stream_ball(d: int, eps: float) -> CoresetBall | EnclosingBall:
+        """Create the ball of a stream of points in dimension d."""
+        if d <= WELZL_MAX_DIM:
+            return CoresetBall(d, eps=eps)
+        return EnclosingBall(solver="CLARABEL")
+
+    @staticmethod
+    def _update(ball: CoresetBall | EnclosingBall, matrix: np.ndarray) -> CoresetBall | EnclosingBall:
+        """Add a record batch of a stream to its ball, returning the updated ball."""
+        return ball.update(matrix)
+
+    @staticmethod
+    def _finalize(ball: CoresetBall | EnclosingBall) -> dict[str, Any]:
+        """Compute the response of a stream from its ball, with the achieved accuracy."""
+        radius, lower = ball.radius, ball.lower
+        eps = radius / lower - 1.0 if lower > 0 else 0.0
+        return {"radius": radius, "midpoint": ball.midpoint, "lower": lower, "eps": eps, "count": ball.count}
+
+    def do_get(self, context: fl.ServerCallContext, ticket: fl.Ticket) -> fl.RecordBatchStream:
+        """Handle a GET request, solving all groups at once for batch commands.
+
+        Args:
+            context: The request context.
+            ticket: The ticket containing the command.
+
+        Returns:
+            A stream with the response table.
+
+        Raises:
+            FlightServerError: If no data is found for the requested command.
+        """
+        command = self._extract_command_from_ticket(ticket)
+        if _is_command(command, STREAM_COMMAND):
+            # the ball was finalized when the upload closed
+            if command not in self._storage:
+                raise fl.FlightServerError(f"No data found for command: {command}")
+            return fl.RecordBatchStream(self._storage[command])
+
+        if not _is_command(command, BATCH_COMMAND):
+            return super().do_get(context, ticket)
+
+        self.logger.info(f"Processing batch GET request for command: {command}")
+        if command not in self._storage:
+            raise fl.FlightServerError(f"No data found for command: {command}")
+
+        table = self._submit(type(self)._solve_batch, self._storage[command]).result()
+        return fl.RecordBatchStream(table)
+
+    @staticmethod
+    def _solve_batch(table: pa.Table) -> pa.Table:
+        """Compute the smallest enclosing ball of every group of points in a table.
+
+        Args:
+            table: A table with a group column and one column per coordinate.
+
+        Returns:
+            A table with one row per group, in sorted order of the groups, holding
+            the group, the radius and one column per coordinate of the center.
+
+        Raises:
+            ValueError: If the table has no group column or no points.
+        """
+        if GROUP_COLUMN not in table.column_names:
+            raise ValueError(f"Batch has no {GROUP_COLUMN} column")
+        if table.num_rows == 0:
+            raise ValueError("Matrix has no values")
+
+        names = [name for name in table.column_names if name != GROUP_COLUMN]
+        points = np.column_stack([table.column(name).to_numpy() for name in names]).astype(float)
+
+        # sort the points by group into the layout of min_circle_batch
+        groups, inverse, counts = np.unique(
+            table.column(GROUP_COLUMN).to_numpy(), return_inverse=True, return_counts=True
+        )
+        order = np.argsort(inverse, kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        radii, centers = min_circle_batch(points[order], offsets)
+
+        columns = {GROUP_COLUMN: groups, "radius": radii}
+        columns.update({name: centers[:, j] for j, name in enumerate(names)})
+        return pa.table(columns)
+
+    def health(self) -> dict[str, Any]:
+        """Report the load of the server.
+
+        Returns:
+            A dictionary with the numbers of workers, admitted and rejected solves,
+            the queue capacity and the hits and misses of the cache.
+        """
+        with self._counter_lock:
+            pending, rejected = self._pending, self._rejected
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "pending": pending,
+            "capacity": self.workers + self.queue_size,
+            "rejected": rejected,
+            "cache": {"entries": len(self.cache), "hits": self.cache.hits, "misses": self.cache.misses},
+        }
+
+    def list_actions(self, context: fl.ServerCallContext) -> list[tuple[str, str]]:
+        """List the actions of the server.
+
+        Args:
+            context: The request context.
+
+        Returns:
+            The names and descriptions of the actions.
+        """
+        return [("health", "Report the load of the server as JSON")]
+
+    def do_action(self, context: fl.ServerCallContext, action: fl.Action) -> Iterator[bytes]:
+        """Run an action. Actions do not wait for the solver pool.
+
+        Args:
+            context: The request context.
+            action: The action, only "health" is supported.
+
+        Yields:
+            The JSON encoded result.
+
+        Raises:
+            FlightServerError: If the action is unknown.
+        """
+        if action.type != "health":
+            raise fl.FlightServerError(f"Unknown action: {action.type}")
+        yield json.dumps(self.health()).encode()
+
+    def shutdown(self) -> None:
+        """Shut down the server and its solver pool."""
+        super().shutdown()
+        self._pool.shutdown()
+
+    @staticmethod
+    def _solve(matrix: np.ndarray, time_budget: float | None, lean: bool = False) -> dict[str, np.ndarray]:
+        """Compute the response for a set of points.
+
+        Args:
+            matrix: A numpy array of shape (n, d) with n >= 1.
+            time_budget: The wall-clock budget in seconds, or None.
+            lean: Whether to return the support points instead of all points.
+
+        Returns:
+            The response dictionary as described in f.
+        """
+        lower = None
+        if time_budget is not None:
+            # anytime solver, answers within the budget with certified bounds
+            lower, radius, midpoint = min_circle_anytime(matrix, time_budget, solver="CLARABEL")
+        elif matrix.shape[1] <= WELZL_MAX_DIM:
+            # exact combinatorial solver, no conic program needed in low dimensions
+            radius, midpoint = min_circle_welzl(matrix)
+        else:
+            # same shapes recur, reuse the compiled problem, solved on points of unit scale
+            # as the solver tolerances are absolute
+            shift = matrix.mean(axis=0)
+            scale = float(np.ptp(matrix, axis=0).max()) or 1.0
+            radius, midpoint = min_circle_cvx((matrix - shift) / scale, cache=True, solver="CLARABEL")
+            radius, midpoint = radius * scale, shift + scale * midpoint
 
         # Return a dictionary with the results
-        return {"radius": radius, "midpoint": midpoint, "points": matrix}
+        result = {"radius": radius, "midpoint": midpoint}
+        if lean:
+            # only the points on the boundary go back over the wire, measured against the
+            # largest distance to the midpoint as the solver radius may exceed all of them
+            u = matrix - midpoint
+            support = support_indices(matrix, midpoint, float(np.sqrt(np.einsum("ij,ij->i", u, u).max())))
+            result.update(support=support, support_points=matrix[support])
+        else:
+            result["points"] = matrix
+        if lower is not None:
+            result["lower"] = lower
+        return result
 
 
 if __name__ == "__main__":  # pragma: no cover
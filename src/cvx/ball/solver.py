@@ -1,37 +1,136 @@
 """Solver module for the CVX Ball package.
 
 This module provides functions to compute the smallest enclosing ball
-for a set of points using convex optimization with CVXPY.
+for a set of points using convex optimization with CVXPY or directly
+with Clarabel, an exact combinatorial solver for low-dimensional inputs
+and an approximate core-set solver for large inputs.
 """
 
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
+import clarabel
 import cvxpy as cp
 import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import nnls
 
+# Largest dimension for which the combinatorial solver is preferred over the SOCP
+WELZL_MAX_DIM = 5
 
-def min_circle_cvx(points: np.ndarray, **kwargs: dict[str, Any]) -> tuple[float, np.ndarray]:
-    """Compute the smallest enclosing ball for a set of points using convex optimization.
+# Relative tolerance used when testing whether a point lies inside a ball
+_REL_TOL = 1e-10
 
-    This function formulates the minimum enclosing ball problem as a second-order cone
-    program (SOCP) and solves it using CVXPY.
+# Relative accuracy of the conic solvers, used to identify support points and violators
+_SOLVER_TOL = 1e-7
+
+# Number of rows processed at once in farthest-point passes, bounds temporary memory
+_CHUNK_SIZE = 65536
+
+# Diagnostics collected by the current call of min_circle_cvx with full_output=True
+_diagnostics: ContextVar[dict[str, Any] | None] = ContextVar("diagnostics", default=None)
+
+
+@dataclass
+class SolveResult:
+    """Result of min_circle_cvx with solver diagnostics.
+
+    Unpacks like the tuple returned by default, radius, midpoint = result.
+
+    Attributes:
+        radius: The radius of the smallest enclosing ball.
+        midpoint: The center point of the ball.
+        status: The status of the last conic solve, "optimal" if no solve was needed.
+        objective: The optimal value of the last conic solve, the radius if no solve was needed.
+        iterations: The number of interior-point iterations, summed over all solves.
+        solves: The number of conic solves.
+        timings: Wall-clock seconds per phase: "build" for preprocessing and building
+                the problems, "canonicalize" for the CVXPY compilation, "solve" for
+                the solver and "extract" for the support and violation pass.
+        support: The indices of the points on the boundary of the ball.
+        max_violation: The largest distance of any point outside the ball.
+        count: The number of input points.
+        compacted: The number of points removed as duplicates.
+        prefiltered: The number of points discarded by the interior-point prefilter.
+    """
+
+    radius: float
+    midpoint: np.ndarray
+    status: str
+    objective: float
+    iterations: int
+    solves: int
+    timings: dict[str, float]
+    support: np.ndarray
+    max_violation: float
+    count: int
+    compacted: int = 0
+    prefiltered: int = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over radius and midpoint, like the default return value."""
+        return iter((self.radius, self.midpoint))
+
+    @property
+    def compaction_ratio(self) -> float:
+        """Get the fraction of the input points left after compaction."""
+        return (self.count - self.compacted) / self.count if self.count else 1.0
+
+
+def _record(key: str, value: Any) -> None:
+    """Add a value to the diagnostics of the current call, if any are collected."""
+    diagnostics = _diagnostics.get()
+    if diagnostics is not None:
+        diagnostics[key].append(value)
+
+
+def _solve(problem: cp.Problem, **kwargs: dict[str, Any]) -> None:
+    """Solve a conic problem and record its diagnostics.
 
     Args:
-        points: A numpy array of shape (n, d) where n is the number of points
-               and d is the dimension.
+        problem: The problem to solve.
         **kwargs: Additional keyword arguments to pass to the CVXPY solver.
-                 Common options include 'solver' to specify which solver to use.
+    """
+    start = time.perf_counter()
+    problem.solve(**kwargs)
+    elapsed = time.perf_counter() - start
+
+    compilation = problem.compilation_time or 0.0
+    stats = problem.solver_stats
+    _record("solves", (problem.status, problem.value, stats.num_iters or 0, compilation, elapsed - compilation))
+
+
+def support_indices(points: np.ndarray, center: np.ndarray, radius: float, tol: float = _SOLVER_TOL) -> np.ndarray:
+    """Find the points on the boundary of a ball.
+
+    Args:
+        points: A numpy array of shape (n, d).
+        center: The center of the ball of shape (d,).
+        radius: The radius of the ball.
+        tol: The relative tolerance on the distance to the center.
 
     Returns:
-        A tuple containing:
-            - The radius of the smallest enclosing ball (float)
-            - The center point of the ball (numpy array of shape (d,))
+        The indices of the points whose distance to the center is at least (1 - tol) * radius.
+    """
+    u = points - center
+    dist = np.sqrt(np.einsum("ij,ij->i", u, u))
+    return np.flatnonzero(dist >= radius * (1.0 - tol))
 
-    Note:
-        The problem is formulated as:
-        minimize r
-        subject to ||p_i - x||_2 <= r for all points p_i
-        where r is the radius and x is the center of the ball.
+
+def _formulation(points: np.ndarray | cp.Parameter) -> tuple[cp.Problem, cp.Variable, cp.Variable]:
+    """Formulate the minimum enclosing ball problem as a second-order cone program.
+
+    Args:
+        points: The points of shape (n, d), either as a numpy array or as a
+               CVXPY parameter. The formulation is DPP-compliant in the latter case.
+
+    Returns:
+        A tuple (problem, radius variable, midpoint variable).
     """
     # Create cvxpy variable for the radius
     r = cp.Variable(shape=1, name="Radius")
@@ -52,9 +151,1107 @@ def min_circle_cvx(points: np.ndarray, **kwargs: dict[str, Any]) -> tuple[float,
         )
     ]
 
+    # Create the optimization problem
+    return cp.Problem(objective=objective, constraints=constraints), r, x
+
+
+def _closed_form(points: np.ndarray) -> tuple[float, np.ndarray] | None:
+    """Compute the minimum enclosing ball of trivial point sets without a solver.
+
+    Handles a single point, identical points, collinear points (including any two
+    points) and affinely independent points, at most d + 1 of them. For the
+    latter, the circumball of the simplex is the minimum enclosing ball if its
+    center has non-negative barycentric coordinates. Otherwise the vertex with
+    the most negative coordinate is dropped and the circumball of the remaining
+    face is tried, as long as it encloses all points.
+
+    Args:
+        points: A numpy array of shape (n, d).
+
+    Returns:
+        A tuple (radius, center), or None if the problem needs a solver.
+    """
+    n, d = points.shape
+    if n == 0:
+        return None
+
+    # Farthest point from the first one
+    origin = points[0]
+    u = points - origin
+    d2 = np.einsum("ij,ij->i", u, u)
+    far = int(np.argmax(d2))
+    if d2[far] == 0.0:
+        # a single point or identical points
+        return 0.0, origin.copy()
+
+    # Collinear points lie on the line through the first and the farthest point
+    direction = u[far] / np.sqrt(d2[far])
+    t = u @ direction
+    residual = d2 - t**2
+    if residual.max() <= _REL_TOL**2 * d2[far]:
+        lo, hi = t.min(), t.max()
+        return 0.5 * float(hi - lo), origin + 0.5 * (lo + hi) * direction
+
+    if n > d + 1:
+        return None
+
+    active = np.arange(n)
+    while active.size > 1:
+        # The circumcenter is origin + lam @ v and equidistant from all vertices
+        v = points[active[1:]] - points[active[0]]
+        gram = v @ v.T
+        lam, _, rank, _ = np.linalg.lstsq(gram, 0.5 * np.diag(gram), rcond=None)
+        if rank < gram.shape[0]:
+            # affinely dependent points
+            return None
+
+        barycentric = np.concatenate([[1.0 - lam.sum()], lam])
+        if barycentric.min() >= -_REL_TOL:
+            center = points[active[0]] + lam @ v
+            u = points - center
+            d2 = np.einsum("ij,ij->i", u, u)
+            r2 = float(lam @ gram @ lam)
+            if d2.max() > r2 * (1.0 + _REL_TOL):
+                return None
+            return float(np.sqrt(r2)), center
+
+        # Drop the vertex whose facet separates the circumcenter from the simplex
+        active = np.delete(active, np.argmin(barycentric))
+
+    return None
+
+
+def _affine_coordinates(points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Express points in an orthonormal basis of their affine hull.
+
+    The center of the minimum enclosing ball lies in the affine hull of the
+    points, and distances within the hull are preserved by the coordinates, so
+    the problem can be solved in rank(P) <= n - 1 dimensions without loss.
+
+    Args:
+        points: A numpy array of shape (n, d).
+
+    Returns:
+        A tuple (coordinates of shape (n, k), origin of shape (d,), basis of shape (d, k))
+        with points = origin + coordinates @ basis.T and 1 <= k <= max(n - 1, 1).
+    """
+    origin = points.mean(axis=0)
+    _, s, vt = np.linalg.svd(points - origin, full_matrices=False)
+
+    # Numerical rank of the centered points, at least one direction is kept
+    rank = int(np.sum(s > s[0] * max(points.shape) * np.finfo(float).eps)) if s[0] > 0 else 0
+    basis = vt[: max(rank, 1)].T
+    return (points - origin) @ basis, origin, basis
+
+
+# A cached problem: (problem, points parameter, radius variable, midpoint variable)
+_CachedProblem = tuple[cp.Problem, cp.Parameter, cp.Variable, cp.Variable]
+
+
+class ProblemCache:
+    """LRU cache of parameterized minimum enclosing ball problems keyed by shape.
+
+    The points enter the cached problems as a CVXPY parameter. CVXPY keeps the
+    canonicalized problem after the first solve, so repeated solves for the same
+    shape skip compilation and go straight to the solver.
+
+    Problems are checked out while they are solved, so concurrent calls with the
+    same shape never share a problem; they build a second one instead.
+
+    Attributes:
+        maxsize: The maximal number of cached problems.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: The maximal number of cached problems.
+        """
+        self.maxsize = maxsize
+        self._problems: OrderedDict[tuple[int, int], _CachedProblem] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached problems."""
+        return len(self._problems)
+
+    def clear(self) -> None:
+        """Remove all cached problems."""
+        with self._lock:
+            self._problems.clear()
+
+    def acquire(self, shape: tuple[int, int]) -> _CachedProblem:
+        """Check out the problem for a shape, building it if it is not cached.
+
+        Args:
+            shape: The shape (n, d) of the points.
+
+        Returns:
+            A tuple (problem, points parameter, radius variable, midpoint variable).
+        """
+        with self._lock:
+            entry = self._problems.pop(shape, None)
+        if entry is None:
+            parameter = cp.Parameter(shape, name="Points")
+            problem, r, x = _formulation(parameter)
+            entry = (problem, parameter, r, x)
+        return entry
+
+    def release(self, shape: tuple[int, int], entry: _CachedProblem) -> None:
+        """Return a problem to the cache, evicting the least recently used ones.
+
+        Args:
+            shape: The shape (n, d) of the points.
+            entry: The tuple returned by acquire.
+        """
+        with self._lock:
+            self._problems[shape] = entry
+            self._problems.move_to_end(shape)
+            while len(self._problems) > self.maxsize:
+                self._problems.popitem(last=False)
+
+
+# Problems shared by all calls of min_circle_cvx with cache=True
+problem_cache = ProblemCache()
+
+
+def min_circle_cvx(
+    points: np.ndarray,
+    active_set: bool = False,
+    cache: bool = False,
+    prefilter: bool = False,
+    compact: float | None = None,
+    full_output: bool = False,
+    **kwargs: dict[str, Any],
+) -> tuple[float, np.ndarray] | SolveResult:
+    """Compute the smallest enclosing ball for a set of points using convex optimization.
+
+    This function formulates the minimum enclosing ball problem as a second-order cone
+    program (SOCP) and solves it using CVXPY.
+
+    Args:
+        points: A numpy array of shape (n, d) where n is the number of points
+               and d is the dimension.
+        active_set: If True, solve the problem on a small working set of points and
+                   add violating points until all points lie inside the ball. The
+                   optimal ball is defined by at most d + 1 points, so the size of the
+                   conic problems is governed by the support set rather than by n.
+        cache: If True, reuse a parameterized problem of the same shape from
+              problem_cache, skipping the CVXPY canonicalization on repeated solves.
+        prefilter: If True, discard points that provably lie in the interior of the
+                  ball with prefilter_points before solving.
+        compact: If not None, remove duplicate points with compact_points before
+                solving, merging points within a grid of this spacing if positive.
+                The radius then decreases by at most sqrt(d) * compact.
+        full_output: If True, return a SolveResult with solver diagnostics and
+                    phase timings instead of a tuple.
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver.
+                 Common options include 'solver' to specify which solver to use.
+
+    Returns:
+        A tuple containing:
+            - The radius of the smallest enclosing ball (float)
+            - The center point of the ball (numpy array of shape (d,))
+        or a SolveResult if full_output is True.
+
+    Note:
+        The problem is formulated as:
+        minimize r
+        subject to ||p_i - x||_2 <= r for all points p_i
+        where r is the radius and x is the center of the ball.
+
+        If there are no more points than dimensions, the problem is solved
+        exactly in the coordinates of the affine hull of the points, so the
+        cones have dimension at most n instead of d + 1.
+
+        Single, identical and collinear points as well as simplices are solved
+        in closed form without a solver, see _closed_form.
+    """
+    if full_output:
+        return _solve_result(points, active_set=active_set, cache=cache, prefilter=prefilter, compact=compact, **kwargs)
+
+    closed = _closed_form(points)
+    if closed is not None:
+        return closed
+
+    if compact is not None:
+        keep, removed = compact_points(points, compact)
+        _record("compacted", removed)
+        return min_circle_cvx(points[keep], active_set=active_set, cache=cache, prefilter=prefilter, **kwargs)
+
+    if prefilter:
+        keep, removed = prefilter_points(points, **kwargs)
+        _record("prefiltered", removed)
+        return min_circle_cvx(points[keep], active_set=active_set, cache=cache, **kwargs)
+
+    if points.shape[0] <= points.shape[1] > 1:
+        coordinates, origin, basis = _affine_coordinates(points)
+        radius, center = min_circle_cvx(coordinates, active_set=active_set, cache=cache, **kwargs)
+        return radius, origin + basis @ center
+
+    if active_set:
+        return _min_circle_active_set(points, **kwargs)
+
+    if cache:
+        entry = problem_cache.acquire(points.shape)
+        problem, parameter, r, x = entry
+        try:
+            parameter.value = points
+            _solve(problem, **kwargs)
+            return r.value[0], x.value
+        finally:
+            problem_cache.release(points.shape, entry)
+
     # Create and solve the optimization problem
-    problem = cp.Problem(objective=objective, constraints=constraints)
-    problem.solve(**kwargs)
+    problem, r, x = _formulation(points)
+    _solve(problem, **kwargs)
 
     # Return the optimal radius and midpoint
     return r.value[0], x.value
+
+
+def _solve_result(points: np.ndarray, **kwargs: dict[str, Any]) -> SolveResult:
+    """Run min_circle_cvx and collect its diagnostics.
+
+    Args:
+        points: A numpy array of shape (n, d).
+        **kwargs: The keyword arguments of min_circle_cvx, without full_output.
+
+    Returns:
+        The result with solver diagnostics and phase timings.
+    """
+    diagnostics: dict[str, list] = {"solves": [], "compacted": [], "prefiltered": []}
+    token = _diagnostics.set(diagnostics)
+    try:
+        start = time.perf_counter()
+        radius, center = min_circle_cvx(points, **kwargs)
+        elapsed = time.perf_counter() - start
+    finally:
+        _diagnostics.reset(token)
+
+    start = time.perf_counter()
+    u = points - center
+    dist = np.sqrt(np.einsum("ij,ij->i", u, u))
+    support = support_indices(points, center, radius)
+    max_violation = max(float(dist.max()) - float(radius), 0.0)
+    extract = time.perf_counter() - start
+
+    solves = diagnostics["solves"]
+    canonicalize = sum((solve[3] for solve in solves), 0.0)
+    solve = sum((solve[4] for solve in solves), 0.0)
+
+    return SolveResult(
+        radius=float(radius),
+        midpoint=center,
+        status=solves[-1][0] if solves else cp.OPTIMAL,
+        objective=float(solves[-1][1]) if solves else float(radius),
+        iterations=sum(solve[2] for solve in solves),
+        solves=len(solves),
+        timings={
+            "build": elapsed - canonicalize - solve,
+            "canonicalize": canonicalize,
+            "solve": solve,
+            "extract": extract,
+        },
+        support=support,
+        max_violation=max_violation,
+        count=points.shape[0],
+        compacted=sum(diagnostics["compacted"]),
+        prefiltered=sum(diagnostics["prefiltered"]),
+    )
+
+
+def min_circle_clarabel(points: np.ndarray, **kwargs: dict[str, Any]) -> tuple[float, np.ndarray]:
+    """Compute the smallest enclosing ball for a set of points by calling Clarabel directly.
+
+    The conic problem has a completely regular structure, so it is assembled
+    directly in the standard form of Clarabel without CVXPY:
+
+        minimize r
+        subject to b - A z in K, z = (r, x)
+
+    where K is the product of n second-order cones of dimension d + 1 and the
+    slack of cone i is (r, p_i - x). The sparse matrix A is built in CSC format
+    from index arithmetic; its column for r holds a -1 in the first row of each
+    cone and the column for x_j holds a 1 in row j of each cone.
+
+    Args:
+        points: A numpy array of shape (n, d) where n is the number of points
+               and d is the dimension.
+        **kwargs: Settings of the Clarabel solver, e.g. tol_gap_rel or max_iter.
+
+    Returns:
+        A tuple containing:
+            - The radius of the smallest enclosing ball (float)
+            - The center point of the ball (numpy array of shape (d,))
+
+    Raises:
+        SolverError: If Clarabel stops without solving the problem, e.g. at max_iter.
+    """
+    closed = _closed_form(points)
+    if closed is not None:
+        return closed
+
+    n, d = points.shape
+    if n <= d > 1:
+        # Solve exactly in the coordinates of the affine hull of the points
+        coordinates, origin, basis = _affine_coordinates(points)
+        radius, center = min_circle_clarabel(coordinates, **kwargs)
+        return radius, origin + basis @ center
+
+    # Shift the points to their mean for better conditioning
+    shift = points.mean(axis=0)
+
+    # Cone i occupies the rows i * (d + 1), ..., i * (d + 1) + d
+    rows = np.arange(n, dtype=np.int64) * (d + 1)
+    indices = (rows[None, :] + np.arange(d + 1)[:, None]).ravel()
+    indptr = np.arange(d + 2, dtype=np.int64) * n
+    data = np.ones((d + 1) * n)
+    data[:n] = -1.0
+    a = sp.csc_matrix((data, indices, indptr), shape=(n * (d + 1), d + 1))
+
+    # b stacks (0, p_i - shift) for all points
+    b = np.zeros((n, d + 1))
+    b[:, 1:] = points - shift
+
+    q = np.zeros(d + 1)
+    q[0] = 1.0
+    p = sp.csc_matrix((d + 1, d + 1))
+    cones = [clarabel.SecondOrderConeT(d + 1)] * n
+
+    settings = clarabel.DefaultSettings()
+    settings.verbose = False
+    for key, value in kwargs.items():
+        setattr(settings, key, value)
+
+    solution = clarabel.DefaultSolver(p, q, a, b.ravel(), cones, settings).solve()
+    if str(solution.status) not in ("Solved", "AlmostSolved"):
+        raise cp.error.SolverError(f"Clarabel did not solve the problem: {solution.status}")
+    z = np.asarray(solution.x)
+
+    # Return the optimal radius and midpoint
+    return float(z[0]), z[1:] + shift
+
+
+def _min_circle_active_set(points: np.ndarray, **kwargs: dict[str, Any]) -> tuple[float, np.ndarray]:
+    """Solve the minimum enclosing ball problem by constraint generation.
+
+    The working set is seeded with the extreme points along each coordinate axis.
+    After each solve, a single vectorized pass computes the distances of all points
+    to the center, and the d + 1 worst violators are added to the working set.
+
+    Args:
+        points: A numpy array of shape (n, d).
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver.
+
+    Returns:
+        A tuple (radius, center) identical to the full formulation within the solver tolerance.
+    """
+    n, d = points.shape
+
+    # The solver tolerances are absolute, so solve on points of unit scale
+    shift = points.mean(axis=0)
+    scale = float(np.ptp(points, axis=0).max()) or 1.0
+
+    # Seed the working set with the extreme points along each coordinate axis
+    working = np.zeros(n, dtype=bool)
+    working[np.argmin(points, axis=0)] = True
+    working[np.argmax(points, axis=0)] = True
+
+    while True:
+        radius, center = min_circle_cvx((points[working] - shift) / scale, **kwargs)
+        radius, center = radius * scale, shift + scale * center
+
+        # Distances of all points outside the working set beyond the ball
+        u = points - center
+        violation = np.sqrt(np.einsum("ij,ij->i", u, u)) - radius
+        violation[working] = -np.inf
+        outside = np.flatnonzero(violation > _SOLVER_TOL * radius)
+        if outside.size == 0:
+            return radius, center
+
+        # Add the worst violators
+        worst = outside[np.argsort(violation[outside])[-(d + 1) :]]
+        working[worst] = True
+
+
+def _solve_balls(centers: np.ndarray, radii: np.ndarray, **kwargs: dict[str, Any]) -> tuple[float, np.ndarray]:
+    """Solve the minimum enclosing ball of balls problem as a second-order cone program.
+
+    Args:
+        centers: The centers of the balls of shape (n, d).
+        radii: The radii of the balls of shape (n,).
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver.
+
+    Returns:
+        A tuple (radius, center).
+    """
+    n, d = centers.shape
+    r = cp.Variable(shape=1, name="Radius")
+    x = cp.Variable(d, name="Midpoint")
+
+    # For each ball, ||c_i - x||_2 + r_i <= r, i.e. (r - r_i, c_i - x) in the second-order cone
+    constraints = [cp.SOC(cp.multiply(np.ones(n), r) - radii, centers - cp.outer(np.ones(n), x), axis=1)]
+
+    problem = cp.Problem(objective=cp.Minimize(r), constraints=constraints)
+    problem.solve(**kwargs)
+    return r.value[0], x.value
+
+
+def min_ball_of_balls(
+    centers: np.ndarray, radii: np.ndarray, active_set: bool = True, **kwargs: dict[str, Any]
+) -> tuple[float, np.ndarray]:
+    """Compute the smallest ball enclosing a set of balls.
+
+    This allows rolling up cached balls of subgroups into the ball of their union
+    without going back to the points. The problem is the second-order cone program
+
+        minimize R
+        subject to ||c_i - x||_2 + r_i <= R for all balls (c_i, r_i)
+
+    With active_set=True, it is solved by constraint generation as in
+    min_circle_cvx: the working set is seeded with the balls reaching farthest
+    along each coordinate axis, and after each solve the d + 1 balls reaching
+    farthest beyond the ball are added, until all balls are enclosed.
+
+    Args:
+        centers: A numpy array of shape (n, d) with the centers of the balls.
+        radii: A numpy array of shape (n,) with the radii of the balls.
+        active_set: Whether to solve the problem on a small working set of balls.
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver.
+
+    Returns:
+        A tuple containing:
+            - The radius of the smallest enclosing ball (float)
+            - The center point of the ball (numpy array of shape (d,))
+
+    Raises:
+        ValueError: If there are no balls, the centers and radii do not match,
+                   or a radius is negative.
+    """
+    centers = np.atleast_2d(np.asarray(centers, dtype=float))
+    radii = np.asarray(radii, dtype=float).ravel()
+
+    if centers.shape[0] == 0:
+        raise ValueError("Matrix has no values")
+    if radii.size != centers.shape[0]:
+        raise ValueError("Centers and radii do not match")
+    if np.any(radii < 0):
+        raise ValueError("Radius must not be negative")
+
+    if not active_set:
+        return _solve_balls(centers, radii, **kwargs)
+
+    n, d = centers.shape
+
+    # The solver tolerances are absolute, so solve on balls of unit scale
+    shift = centers.mean(axis=0)
+    scale = float(max(np.ptp(centers, axis=0).max(), radii.max())) or 1.0
+
+    # Seed the working set with the balls reaching farthest along each coordinate axis
+    working = np.zeros(n, dtype=bool)
+    working[np.argmin(centers - radii[:, None], axis=0)] = True
+    working[np.argmax(centers + radii[:, None], axis=0)] = True
+
+    while True:
+        radius, center = _solve_balls((centers[working] - shift) / scale, radii[working] / scale, **kwargs)
+        radius, center = radius * scale, shift + scale * center
+
+        # Reach of all balls outside the working set beyond the ball
+        u = centers - center
+        violation = np.sqrt(np.einsum("ij,ij->i", u, u)) + radii - radius
+        violation[working] = -np.inf
+        outside = np.flatnonzero(violation > _SOLVER_TOL * radius)
+        if outside.size == 0:
+            return radius, center
+
+        # Add the worst violators
+        worst = outside[np.argsort(violation[outside])[-(d + 1) :]]
+        working[worst] = True
+
+
+def _circumball(boundary: np.ndarray) -> tuple[np.ndarray, float] | None:
+    """Compute the smallest ball that has all given points on its boundary.
+
+    The center lies in the affine hull of the points and is found by solving
+    the (k-1) x (k-1) Gram system of the edge vectors spanned from the first point.
+
+    Args:
+        boundary: A numpy array of shape (k, d) with 1 <= k <= d + 1 points.
+
+    Returns:
+        A tuple (center, squared radius), or None if the points are
+        numerically affinely dependent and no such ball exists.
+    """
+    origin = boundary[0]
+    if boundary.shape[0] == 1:
+        return origin.copy(), 0.0
+
+    # The center is origin + lam @ v and equidistant from all boundary points
+    v = boundary[1:] - origin
+    gram = v @ v.T
+    rhs = 0.5 * np.einsum("ij,ij->i", v, v)
+
+    lam, _, rank, _ = np.linalg.lstsq(gram, rhs, rcond=None)
+    if rank < gram.shape[0]:
+        # duplicate or (numerically) collinear boundary points
+        return None
+
+    offset = lam @ v
+    return origin + offset, float(offset @ offset)
+
+
+def _move_to_front(
+    points: np.ndarray, order: list[int], end: int, boundary: list[int], abs_tol: float
+) -> tuple[np.ndarray | None, float, list[int]] | None:
+    """Run Welzl's move-to-front recursion on a small list of candidate points.
+
+    Computes the smallest ball enclosing points[order[:end]] with all points
+    in boundary on its surface. Violating points are moved to the front of
+    order, so that they are tested first in subsequent calls.
+
+    Args:
+        points: The full numpy array of shape (n, d).
+        order: Indices of the candidate points, reordered in place.
+        end: Only the first end entries of order are considered.
+        boundary: Indices of points required to lie on the boundary of the ball.
+        abs_tol: Absolute tolerance on squared distances for containment tests.
+
+    Returns:
+        A tuple (center, squared radius, support indices), or None if the
+        boundary points are degenerate. An empty ball has center None and
+        squared radius -inf.
+    """
+    if boundary:
+        ball = _circumball(points[boundary])
+        if ball is None:
+            return None
+        center, r2 = ball
+    else:
+        center, r2 = None, -np.inf
+
+    support = list(boundary)
+    if len(boundary) == points.shape[1] + 1:
+        # the ball is fully determined by d + 1 boundary points
+        return center, r2, support
+
+    for i in range(end):
+        j = order[i]
+        if center is not None:
+            u = points[j] - center
+            if u @ u <= r2 * (1.0 + _REL_TOL) + abs_tol:
+                continue
+
+        # point j lies outside: it has to be on the boundary of the new ball
+        ball = _move_to_front(points, order, i, boundary + [j], abs_tol)
+        if ball is None:
+            # numerically degenerate, j is (within tolerance) on the current ball
+            continue
+        center, r2, support = ball
+        order.insert(0, order.pop(i))
+
+    return center, r2, support
+
+
+def _pivot_welzl(
+    points: np.ndarray, support: list[int] | None = None, max_iter: int = 1000
+) -> tuple[np.ndarray, float, list[int]]:
+    """Compute the minimum enclosing ball with the pivoting move-to-front scheme.
+
+    Each iteration finds the point farthest from the current center with a
+    single vectorized pass and recomputes the exact ball of the current
+    support set plus that point. The squared radius increases strictly, so
+    the iteration terminates after finitely many steps.
+
+    Args:
+        points: A numpy array of shape (n, d) with n >= 1.
+        support: Optional indices of points to warm start from.
+        max_iter: Upper bound on the number of pivoting steps.
+
+    Returns:
+        A tuple (center, squared radius, support indices).
+    """
+    scale = float(np.ptp(points, axis=0).max(initial=0.0))
+    abs_tol = (1e-12 * scale) ** 2
+
+    order = list(support) if support else [0]
+    center, r2, support = _move_to_front(points, order, len(order), [], abs_tol)
+
+    for _ in range(max_iter):
+        u = points - center
+        d2 = np.einsum("ij,ij->i", u, u)
+        k = int(np.argmax(d2))
+        if d2[k] <= r2 * (1.0 + _REL_TOL) + abs_tol:
+            break
+
+        # put the pivot first, it must lie on the boundary of the new ball
+        order = [k] + [j for j in support if j != k]
+        new_center, new_r2, new_support = _move_to_front(points, order, len(order), [], abs_tol)
+        if new_r2 <= r2:
+            # no progress possible in floating point arithmetic
+            break
+        center, r2, support = new_center, new_r2, new_support
+
+    return center, r2, support
+
+
+def min_circle_welzl(points: np.ndarray) -> tuple[float, np.ndarray]:
+    """Compute the smallest enclosing ball for a set of points with an exact combinatorial algorithm.
+
+    This function uses the pivoting variant of Welzl's move-to-front algorithm.
+    It needs no conic solver and runs in expected linear time for fixed d. The
+    small recursive subproblems grow quickly with the dimension, so the solver is
+    meant for low-dimensional inputs (d <= WELZL_MAX_DIM).
+
+    Args:
+        points: A numpy array of shape (n, d) where n is the number of points
+               and d is the dimension.
+
+    Returns:
+        A tuple containing:
+            - The radius of the smallest enclosing ball (float)
+            - The center point of the ball (numpy array of shape (d,))
+
+    Raises:
+        ValueError: If the array has no points.
+    """
+    points = np.asarray(points, dtype=float)
+    if points.shape[0] == 0:
+        raise ValueError("Matrix has no values")
+
+    center, r2, _ = _pivot_welzl(points)
+    return float(np.sqrt(r2)), center
+
+
+def _farthest_point(points: np.ndarray, center: np.ndarray, chunk_size: int = _CHUNK_SIZE) -> tuple[int, float]:
+    """Find the point farthest from a center with a chunked, vectorized pass.
+
+    Args:
+        points: A numpy array of shape (n, d), any array supporting row slicing works.
+        center: The reference point of shape (d,).
+        chunk_size: Number of rows processed at once.
+
+    Returns:
+        A tuple (index, squared distance) of the farthest point.
+    """
+    best, best_d2 = 0, -np.inf
+    for start in range(0, points.shape[0], chunk_size):
+        u = np.asarray(points[start : start + chunk_size], dtype=float) - center
+        d2 = np.einsum("ij,ij->i", u, u)
+        k = int(np.argmax(d2))
+        if d2[k] > best_d2:
+            best, best_d2 = start + k, float(d2[k])
+    return best, best_d2
+
+
+def _exact_support(points: np.ndarray, **kwargs: dict[str, Any]) -> tuple[np.ndarray, float, list[int]]:
+    """Compute the exact minimum enclosing ball of a small set of points and its support.
+
+    Low-dimensional problems are solved combinatorially, all others with the
+    conic formulation. In the latter case the radius is the largest distance of
+    the points to the center found by the solver, and the support consists of
+    the points on the boundary of the ball within the solver tolerance.
+
+    Args:
+        points: A numpy array of shape (n, d).
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver.
+
+    Returns:
+        A tuple (center, squared radius, support indices).
+    """
+    if points.shape[1] <= WELZL_MAX_DIM:
+        return _pivot_welzl(points)
+
+    # The solver tolerances are absolute, so solve on points of unit scale
+    shift = points.mean(axis=0)
+    scale = float(np.ptp(points, axis=0).max()) or 1.0
+    _, center = min_circle_cvx((points - shift) / scale, **kwargs)
+    center = shift + scale * center
+
+    # the largest distance to the center, so the farthest point is always in the support
+    u = points - center
+    r2 = float(np.einsum("ij,ij->i", u, u).max())
+    support = support_indices(points, center, np.sqrt(r2)).tolist()
+    return center, r2, support
+
+
+def compact_points(points: np.ndarray, tol: float = 0.0) -> tuple[np.ndarray, int]:
+    """Remove duplicate and, optionally, nearly duplicate points.
+
+    With tol=0, exact duplicates are removed. Otherwise the points are assigned
+    to the cells of a grid with spacing tol, and one point is kept per cell. Each
+    removed point lies within sqrt(d) * tol of a kept one, so the minimum enclosing
+    ball of the kept points, with radius r, satisfies r <= r* <= r + sqrt(d) * tol.
+
+    Rows are compared as raw bytes with a single vectorized unique over a void view.
+
+    Args:
+        points: A numpy array of shape (n, d).
+        tol: The spacing of the grid, 0 removes exact duplicates only.
+
+    Returns:
+        A tuple containing:
+            - The indices of the kept points in increasing order (numpy array of ints)
+            - The number of removed points (int)
+
+    Raises:
+        ValueError: If the tolerance is negative, or so small relative to the
+                   points that the grid cells do not fit into 64-bit integers.
+    """
+    if tol < 0:
+        raise ValueError("Tolerance must not be negative")
+
+    n, d = points.shape
+    if tol > 0 and n and float(np.abs(points).max()) / tol >= 2.0**63:
+        raise ValueError("Tolerance too small for the magnitude of the points, the grid cells overflow")
+    # Adding 0.0 maps -0.0 to 0.0, so both have the same bytes
+    keys = np.floor(points / tol).astype(np.int64) if tol > 0 else np.asarray(points, dtype=float) + 0.0
+    keys = np.ascontiguousarray(keys)
+    rows = keys.view(np.dtype((np.void, keys.dtype.itemsize * d))).ravel()
+
+    _, first = np.unique(rows, return_index=True)
+    keep = np.sort(first)
+    return keep, n - keep.size
+
+
+def prefilter_points(
+    points: np.ndarray, directions: int = 64, seed: int | None = 0, **kwargs: dict[str, Any]
+) -> tuple[np.ndarray, int]:
+    """Discard points that provably lie in the interior of the minimum enclosing ball.
+
+    The extreme points E of the point set along the coordinate axes and random
+    directions are collected, and their minimum enclosing ball (c_E, r_E) is
+    computed. Any center c satisfies max_E ||p - c||^2 >= r_E^2 + ||c - c_E||^2.
+    The solver returns an approximate center c, whose largest distance rho to E
+    and the certified lower bound L <= r_E <= r* of _lower_bound give
+    ||c - c_E||^2 <= rho^2 - L^2. The ball around c through the farthest point
+    is an upper bound, r* <= R, so the optimal center c* satisfies
+
+        ||c* - c|| <= sqrt(R^2 - L^2) + sqrt(rho^2 - L^2) = delta
+
+    Every point with ||p - c|| + delta < L is therefore strictly inside the
+    optimal ball, cannot be a support point and is discarded without changing
+    the solution. As L <= R, the farthest point is always kept. The screening
+    costs one pass with a (d, directions) projection.
+
+    Args:
+        points: A numpy array of shape (n, d).
+        directions: The number of random directions for the extreme points.
+        seed: The seed of the random directions.
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver,
+                 used for the extreme points if d > WELZL_MAX_DIM.
+
+    Returns:
+        A tuple containing:
+            - The indices of the remaining candidate points (numpy array of ints)
+            - The number of discarded points (int)
+    """
+    n, d = points.shape
+    if n <= 2 * (d + directions):
+        return np.arange(n), 0
+
+    # Extreme points along the coordinate axes and random directions
+    rng = np.random.default_rng(seed)
+    projections = points @ np.hstack([np.eye(d), rng.standard_normal((d, directions))])
+    extreme = np.unique(np.concatenate([np.argmin(projections, axis=0), np.argmax(projections, axis=0)]))
+
+    center, r2, support = _exact_support(points[extreme], **kwargs)
+    lower = _lower_bound(points[extreme][support], center)
+
+    # Distances to the center of the lower-bound ball give the upper bound R
+    u = points - center
+    dist = np.sqrt(np.einsum("ij,ij->i", u, u))
+    delta = np.sqrt(max(dist.max() ** 2 - lower**2, 0.0)) + np.sqrt(max(r2 - lower**2, 0.0))
+
+    keep = dist + delta >= lower * (1.0 - _SOLVER_TOL)
+    keep[np.argmax(dist)] = True
+    keep = np.flatnonzero(keep)
+    return keep, n - keep.size
+
+
+def _violators(
+    points: np.ndarray, center: np.ndarray, r2: float, limit: int, chunk_size: int = _CHUNK_SIZE
+) -> tuple[np.ndarray, float]:
+    """Find the points farthest outside a ball with a chunked, vectorized pass.
+
+    Args:
+        points: A numpy array of shape (n, d), any array supporting row slicing works.
+        center: The center of the ball of shape (d,).
+        r2: The squared radius of the ball.
+        limit: The maximal number of points to return.
+        chunk_size: Number of rows processed at once.
+
+    Returns:
+        A tuple (indices of at most limit points outside the ball, the farthest
+        first, largest squared distance of any point to the center).
+    """
+    index, dist2 = np.zeros(0, dtype=np.int64), np.zeros(0)
+    max_d2 = 0.0
+    for start in range(0, points.shape[0], chunk_size):
+        u = np.asarray(points[start : start + chunk_size], dtype=float) - center
+        d2 = np.einsum("ij,ij->i", u, u)
+        max_d2 = max(max_d2, float(d2.max()))
+
+        outside = np.flatnonzero(d2 > r2)
+        index = np.concatenate([index, start + outside])
+        dist2 = np.concatenate([dist2, d2[outside]])
+        worst = np.argsort(dist2)[::-1][:limit]
+        index, dist2 = index[worst], dist2[worst]
+    return index, max_d2
+
+
+def _lower_bound(support: np.ndarray, center: np.ndarray) -> float:
+    """Compute a certified lower bound for the radius of the minimum enclosing ball.
+
+    For any weights lam >= 0 with sum 1 and any center x, the largest squared
+    distance to x is at least the weighted mean of the squared distances, which
+    is minimized by the weighted mean of the points. Hence the square root of the
+    weighted variance bounds the radius from below, whatever the weights are.
+
+    The weights are the convex combination of the support points closest to the
+    center, found by non-negative least squares with the sum enforced by a heavily
+    weighted row. At the optimum the center is such a combination of the support
+    points, which all lie at distance r, so the bound is tight up to the accuracy
+    of the center.
+
+    Args:
+        support: Points of shape (k, d) from the point set.
+        center: An approximate center of the minimum enclosing ball of the point set.
+
+    Returns:
+        A lower bound for the radius of the minimum enclosing ball of any superset
+        of the support, 0 for an empty support.
+    """
+    if support.shape[0] == 0:
+        return 0.0
+
+    v = support - center
+    scale = max(float(np.abs(v).max()), np.finfo(float).tiny)
+    system = np.vstack([v.T / scale, np.full(support.shape[0], 1e3)])
+    lam, _ = nnls(system, np.append(np.zeros(support.shape[1]), 1e3))
+    lam = lam / lam.sum() if lam.sum() > 0 else np.full(support.shape[0], 1.0 / support.shape[0])
+
+    u = v - lam @ v
+    return float(np.sqrt(max(lam @ np.einsum("ij,ij->i", u, u), 0.0)))
+
+
+def min_circle_certified(
+    points: np.ndarray,
+    tol: float = 1e-6,
+    loose: float = 1e-3,
+    chunk_size: int = _CHUNK_SIZE,
+    **kwargs: dict[str, Any],
+) -> tuple[float, float, np.ndarray]:
+    """Compute a certified enclosing ball with cheap loose solves and an exact polish.
+
+    The ball is computed by constraint generation on a small working set:
+
+    1. The working set is solved with Clarabel at the loose tolerance.
+    2. A chunked, vectorized pass over all points finds the farthest violators.
+    3. The points of the working set near the boundary of the loose ball are
+       polished with an exact small solve.
+    4. The polished ball is certified: all points lie within the upper bound of
+       its center, and the weighted variance of its support is a lower bound.
+
+    Violators are added to the working set until no point lies beyond (1 + tol)
+    times the lower bound, so the returned bounds are within a factor 1 + tol.
+    The interior-point solver only ever sees the working set, so its cost does
+    not grow with n.
+
+    Args:
+        points: A numpy array of shape (n, d), any array supporting row slicing works.
+        tol: The relative gap between the lower and the upper bound.
+        loose: The tolerances of the loose solves.
+        chunk_size: Number of rows processed at once in the certificate passes.
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver,
+                 used for polishing with d > WELZL_MAX_DIM.
+
+    Returns:
+        A tuple containing:
+            - A lower bound for the radius of the smallest enclosing ball (float)
+            - An upper bound for the radius, all points lie within it of the center (float)
+            - The center point of the ball (numpy array of shape (d,))
+
+    Raises:
+        ValueError: If the array has no points.
+        RuntimeError: If the working set stops growing, e.g. because the polish
+                     solver is less accurate than tol.
+    """
+    if points.shape[0] == 0:
+        raise ValueError("Matrix has no values")
+
+    d = points.shape[1]
+    settings = {"tol_gap_abs": loose, "tol_gap_rel": loose, "tol_feas": loose}
+    working = np.array([0])
+
+    while True:
+        candidates = np.asarray(points[working], dtype=float)
+
+        # 1. loose solve of the working set
+        radius, center = min_circle_clarabel(candidates, **settings)
+
+        # 3. polish the points near the boundary of the loose ball with an exact solve,
+        # adding points of the working set outside the polished ball until it encloses all of them
+        u = candidates - center
+        near = np.sqrt(np.einsum("ij,ij->i", u, u)) >= radius * (1.0 - 10.0 * loose)
+        while True:
+            center, r2, support = _exact_support(candidates[near], **kwargs)
+            u = candidates - center
+            outside = np.einsum("ij,ij->i", u, u) > r2 * (1.0 + tol) ** 2
+            if not outside[~near].any():
+                break
+            near |= outside
+
+        # 2. chunked certificate pass over all points against the certified lower bound
+        lower = _lower_bound(candidates[near][support], center)
+        worst, max_d2 = _violators(points, center, (lower * (1.0 + tol)) ** 2, d + 1, chunk_size)
+        if worst.size == 0:
+            # 4. certified bounds
+            upper = float(np.sqrt(max_d2))
+            return min(lower, upper), upper, center
+
+        grown = np.union1d(working, worst)
+        if grown.size == working.size:
+            raise RuntimeError("Working set stopped growing, the polish solve does not enclose it")
+        working = grown
+
+
+def min_circle_anytime(
+    points: np.ndarray,
+    time_budget: float,
+    eps: float = 0.0,
+    chunk_size: int = _CHUNK_SIZE,
+    **kwargs: dict[str, Any],
+) -> tuple[float, float, np.ndarray]:
+    """Compute an enclosing ball within a wall-clock time budget.
+
+    Runs the core-set iterations of min_circle_coreset, which can be stopped after
+    any iteration. Each iteration solves the ball of the core set exactly, which
+    yields a certified lower bound, and measures the exact enclosing radius of its
+    center with a pass over all points, which is an upper bound. The best center
+    seen so far is returned when the budget is exhausted, when the bounds agree
+    within eps or when the ball is exact.
+
+    The budget is checked between iterations, so it is exceeded by at most one
+    iteration: a chunked pass over the points plus a solve on the core set. At
+    least one iteration is run.
+
+    Args:
+        points: A numpy array of shape (n, d), any array supporting row slicing works.
+        time_budget: The wall-clock time budget in seconds.
+        eps: The relative gap between the bounds at which to stop early.
+        chunk_size: Number of rows processed at once in farthest-point passes.
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver,
+                 used for core-set solves with d > WELZL_MAX_DIM.
+
+    Returns:
+        A tuple containing:
+            - A lower bound for the radius of the smallest enclosing ball (float)
+            - The exact enclosing radius of the returned center, an upper bound (float)
+            - The center point of the ball (numpy array of shape (d,))
+
+    Raises:
+        ValueError: If the array has no points.
+    """
+    deadline = time.monotonic() + time_budget
+    if points.shape[0] == 0:
+        raise ValueError("Matrix has no values")
+
+    # Start from the farthest point of an arbitrary point and its own farthest point
+    a, _ = _farthest_point(points, np.asarray(points[0], dtype=float), chunk_size)
+    b, _ = _farthest_point(points, np.asarray(points[a], dtype=float), chunk_size)
+    core = [a] if a == b else [a, b]
+    lower, upper, best = 0.0, np.inf, None
+
+    while True:
+        candidates = np.asarray(points[np.sort(core)], dtype=float)
+        center, _, support = _exact_support(candidates, **kwargs)
+        lower = max(lower, _lower_bound(candidates[support], center))
+
+        k, d2 = _farthest_point(points, center, chunk_size)
+        if np.sqrt(d2) < upper:
+            upper, best = float(np.sqrt(d2)), center
+
+        if upper <= lower * (1.0 + eps) * (1.0 + _REL_TOL) or k in core or time.monotonic() >= deadline:
+            return min(lower, upper), upper, best
+        core.append(k)
+
+
+def min_circle_coreset(
+    points: np.ndarray,
+    eps: float = 1e-3,
+    exact: bool = True,
+    chunk_size: int = _CHUNK_SIZE,
+    **kwargs: dict[str, Any],
+) -> tuple[float, np.ndarray, np.ndarray]:
+    """Compute a (1 + eps)-approximate smallest enclosing ball with the Badoiu-Clarkson core-set algorithm.
+
+    The points are only touched by vectorized farthest-point passes, processed
+    in chunks of bounded size. All other work is done on the core set, which
+    has O(1/eps) points independent of n and d.
+
+    With exact=True, every iteration adds the farthest point to the core set and
+    solves the minimum enclosing ball of the core set exactly, until all points
+    lie within (1 + eps) times its radius. This needs at most O(1/eps) passes.
+    With exact=False, no solver is used at all: the center is moved towards the
+    farthest point with step 1/(i+1). The center is then the mean of the farthest
+    points so far, and their variance is a lower bound for the optimal radius, so
+    the iteration stops as soon as all points lie within (1 + eps) times this
+    bound, after at most ceil(1/eps^2) iterations.
+
+    Args:
+        points: A numpy array of shape (n, d) where n is the number of points
+               and d is the dimension.
+        eps: The relative accuracy of the returned radius.
+        exact: Whether to solve the minimum enclosing ball of the core set exactly.
+        chunk_size: Number of rows processed at once in farthest-point passes.
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver,
+                 used for core-set solves with d > WELZL_MAX_DIM.
+
+    Returns:
+        A tuple containing:
+            - The radius of a ball enclosing all points, at most (1 + eps) times optimal (float)
+            - The center point of the ball (numpy array of shape (d,))
+            - The indices of the core-set points (numpy array of ints)
+
+    Raises:
+        ValueError: If the array has no points, or eps is not positive with exact=False.
+    """
+    if points.shape[0] == 0:
+        raise ValueError("Matrix has no values")
+    if not exact and not eps > 0:
+        raise ValueError("Accuracy eps must be positive without exact core-set solves")
+
+    # Start from the farthest point of an arbitrary point and its own farthest point
+    a, _ = _farthest_point(points, np.asarray(points[0], dtype=float), chunk_size)
+    b, _ = _farthest_point(points, np.asarray(points[a], dtype=float), chunk_size)
+    core = [a] if a == b else [a, b]
+
+    if not exact:
+        # the center is the mean of the farthest points so far, counted with multiplicity
+        center = np.asarray(points[a], dtype=float)
+        weights = {a: 1.0}
+        for i in range(1, int(np.ceil(1.0 / eps**2)) + 1):
+            k, d2 = _farthest_point(points, center, chunk_size)
+
+            # their variance is a lower bound for the optimal radius
+            u = np.asarray(points[np.fromiter(weights, dtype=np.int64)], dtype=float) - center
+            r2 = np.fromiter(weights.values(), dtype=float) @ np.einsum("ij,ij->i", u, u) / i
+            if d2 <= (1.0 + eps) ** 2 * r2:
+                break
+
+            weights[k] = weights.get(k, 0.0) + 1.0
+            center = center + (np.asarray(points[k], dtype=float) - center) / (i + 1)
+        else:
+            _, d2 = _farthest_point(points, center, chunk_size)
+        return float(np.sqrt(d2)), center, np.array(list(weights))
+
+    while True:
+        center, r2, _ = _exact_support(np.asarray(points[np.sort(core)], dtype=float), **kwargs)
+        k, d2 = _farthest_point(points, center, chunk_size)
+        if d2 <= (1.0 + eps) ** 2 * r2 * (1.0 + _REL_TOL) or k in core:
+            break
+        core.append(k)
+
+    return float(np.sqrt(max(d2, r2))), center, np.array(core)
@@ -0,0 +1,296 @@
+"""Stream module for the CVX Ball package.
+
+This module maintains enclosing balls of an append-only stream of points.
+Only a small summary of the stream is kept in memory, the support set of the
+current ball or the extreme points along a fixed set of directions, so the cost
+of an update is proportional to the size of the new chunk, not to the history.
+"""
+
+from math import ceil, sqrt
+from typing import Any
+
+import numpy as np
+
+from .solver import _REL_TOL, _exact_support, _farthest_point
+from .summary import _cover
+
+
+class EnclosingBall:
+    """Incrementally updated enclosing ball of an append-only stream of points.
+
+    Each update first tests the new points against the current ball with a single
+    vectorized pass. If all of them lie inside, nothing else happens. Otherwise the
+    ball is recomputed exactly over the current support set plus the violating points.
+
+    Points inside a ball are discarded, so the minimum enclosing ball of the
+    retained points is a lower bound for the minimum enclosing ball of the whole
+    stream. Every discarded point lies in one of the previous balls, and the
+    previous balls not contained in the current one are kept. The ball around
+    midpoint with radius reaching the farthest of them certifiably contains all
+    points. If there are none, the ball is exact. Once more than max_uncovered
+    previous balls are kept, the two oldest are replaced by the smallest ball
+    enclosing both, so the memory is bounded at the price of a looser radius.
+
+    Alongside, the simple streaming ball of Zarrabi-Zadeh and Chan is kept: a
+    point outside it replaces it by the smallest ball enclosing it and the point.
+    Its radius is at most 3/2 times the optimal radius, so two thirds of it is a
+    lower bound as well. The smaller of both enclosing balls is returned, hence
+
+        lower <= r* <= radius <= 3/2 * lower
+
+    whatever the order of the points.
+
+    Attributes:
+        count: The number of points seen so far.
+        max_uncovered: The maximal number of previous balls kept.
+    """
+
+    def __init__(self, max_uncovered: int = 16, **kwargs: dict[str, Any]) -> None:
+        """Initialize an empty ball.
+
+        Args:
+            max_uncovered: The maximal number of previous balls kept.
+            **kwargs: Additional keyword arguments to pass to min_circle_cvx,
+                     used for dimensions above WELZL_MAX_DIM.
+        """
+        self.count = 0
+        self.max_uncovered = max_uncovered
+        self._kwargs = kwargs
+        self._support: np.ndarray | None = None
+        self._center: np.ndarray | None = None
+        self._r2 = 0.0
+        self._uncovered: list[tuple[np.ndarray, float]] = []
+        self._grown: tuple[np.ndarray, float] | None = None
+
+    def _certified(self) -> float:
+        """Get the radius around the center of the retained points that encloses all points."""
+        reach = [float(np.linalg.norm(self._center - center)) + radius for center, radius in self._uncovered]
+        return max([float(np.sqrt(self._r2)), *reach])
+
+    @property
+    def radius(self) -> float:
+        """Get a radius around midpoint that certifiably encloses all points seen so far."""
+        if self._center is None:
+            return 0.0
+        return min(self._certified(), self._grown[1])
+
+    @property
+    def midpoint(self) -> np.ndarray | None:
+        """Get the center of the smaller enclosing ball, None before the first update."""
+        if self._center is None or self._certified() <= self._grown[1]:
+            return self._center
+        return self._grown[0]
+
+    @property
+    def lower(self) -> float:
+        """Get a lower bound for the optimal radius, at least two thirds of radius."""
+        if self._center is None:
+            return 0.0
+        return max(float(np.sqrt(self._r2)), self._grown[1] / 1.5)
+
+    @property
+    def support(self) -> np.ndarray | None:
+        """Get the support points of the ball, an array of shape (k, d)."""
+        return self._support
+
+    @property
+    def exact(self) -> bool:
+        """Whether the ball is certified to be the minimum enclosing ball of all points seen so far."""
+        return not self._uncovered
+
+    def update(self, chunk: np.ndarray) -> "EnclosingBall":
+        """Add a chunk of points to the stream.
+
+        Args:
+            chunk: A numpy array of shape (m, d) with the new points.
+
+        Returns:
+            The updated ball itself.
+        """
+        chunk = np.atleast_2d(np.asarray(chunk, dtype=float))
+        if chunk.shape[0] == 0:
+            return self
+        self.count += chunk.shape[0]
+        self._grow(chunk)
+
+        if self._center is None:
+            candidates = chunk
+        else:
+            # skip the solve if all new points lie inside the current ball
+            u = chunk - self._center
+            outside = np.einsum("ij,ij->i", u, u) > self._r2 * (1.0 + _REL_TOL)
+            if not outside.any():
+                return self
+            candidates = np.concatenate([self._support, chunk[outside]])
+
+        center, r2, support = _exact_support(candidates, **self._kwargs)
+
+        # points discarded so far lie in the old ball or in earlier uncovered ones
+        if self._center is not None:
+            self._uncovered.append((self._center, float(np.sqrt(self._r2))))
+        radius = float(np.sqrt(r2)) * (1.0 + _REL_TOL)
+        self._uncovered = [(c, r) for c, r in self._uncovered if float(np.linalg.norm(center - c)) + r > radius]
+        while len(self._uncovered) > self.max_uncovered:
+            self._uncovered[:2] = [_cover(*self._uncovered[:2])]
+
+        self._support = candidates[support]
+        self._center, self._r2 = center, r2
+        return self
+
+    def _grow(self, chunk: np.ndarray) -> None:
+        """Grow the streaming ball until it encloses the chunk, the farthest point first."""
+        center, radius = self._grown if self._grown is not None else (chunk[0], 0.0)
+        while chunk.shape[0]:
+            u = chunk - center
+            d2 = np.einsum("ij,ij->i", u, u)
+            outside = d2 > (radius * (1.0 + _REL_TOL)) ** 2
+            if not outside.any():
+                break
+            # the smallest ball enclosing the ball and the farthest point
+            k = int(np.argmax(d2))
+            dist = float(np.sqrt(d2[k]))
+            center = center + 0.5 * (dist - radius) / dist * u[k]
+            radius = 0.5 * (dist + radius)
+            chunk = chunk[outside]
+        self._grown = (center, radius)
+
+
+def _directions(d: int, eps: float, limit: int) -> tuple[np.ndarray, float]:
+    """Compute unit directions covering the sphere from a grid on the faces of the cube [-1, 1]^d.
+
+    For a grid spacing of 2 / m, every unit vector is within an angle theta of
+    a direction with sin(theta) <= sqrt(d - 1) / m. The grid is as fine as needed
+    for 1 / cos(theta) <= 1 + eps, or as fine as limit directions allow.
+
+    Args:
+        d: The dimension.
+        eps: The requested accuracy.
+        limit: The maximal number of directions.
+
+    Returns:
+        The directions of shape (k, d) and the factor 1 / cos(theta).
+
+    Raises:
+        ValueError: If limit directions do not cover the sphere.
+    """
+    if d == 1:
+        return np.array([[1.0], [-1.0]]), 1.0
+
+    m = ceil(sqrt((d - 1) / (1.0 - 1.0 / (1.0 + eps) ** 2)))
+    while m * m > d - 1 and 2 * d * (m + 1) ** (d - 1) > limit:
+        m -= 1
+    if m * m <= d - 1 or 2 * d * (m + 1) ** (d - 1) > limit:
+        raise ValueError(f"More than {limit} directions are needed in dimension {d}")
+
+    axes = np.meshgrid(*[np.linspace(-1.0, 1.0, m + 1)] * (d - 1), indexing="ij")
+    grid = np.stack(axes, axis=-1).reshape(-1, d - 1)
+    faces = [np.insert(grid, j, sign, axis=1) for j in range(d) for sign in (-1.0, 1.0)]
+    directions = np.concatenate(faces)
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    return directions, 1.0 / sqrt(1.0 - (d - 1) / m**2)
+
+
+class CoresetBall:
+    """(1 + eps)-approximate enclosing ball of an append-only stream of points.
+
+    The core set holds the extreme points of the stream along a fixed set of
+    directions, at most one per direction, so its size depends on the dimension
+    and eps only. If c is the center and r the radius of the minimum enclosing
+    ball of the core set, every point p of the stream satisfies
+    |p - c| cos(theta) <= <u, p - c> <= <u, q - c> <= r, where u is the direction
+    closest to p - c and q the extreme point along u. Hence the ball around c
+    with radius r / cos(theta) encloses all points, and r is a lower bound.
+
+    The number of directions grows like (1 / sqrt(eps))^(d - 1), so the core set
+    is meant for low dimensions.
+
+    Attributes:
+        points: The core-set points of shape (k, d).
+        count: The number of points seen so far.
+        eps: The accuracy of the ball, larger than requested if the number of
+            directions is limited.
+    """
+
+    def __init__(self, d: int, eps: float = 1e-2, max_directions: int = 2**16, **kwargs: dict[str, Any]) -> None:
+        """Initialize an empty core set.
+
+        Args:
+            d: The dimension of the points.
+            eps: The requested accuracy of the ball.
+            max_directions: The maximal number of directions.
+            **kwargs: Additional keyword arguments to pass to min_circle_cvx,
+                     used for dimensions above WELZL_MAX_DIM.
+
+        Raises:
+            ValueError: If max_directions directions do not cover the sphere in dimension d.
+        """
+        self._directions, self._factor = _directions(d, eps, max_directions)
+        self.points = np.zeros((0, d))
+        self.count = 0
+        self._extent = np.full(self._directions.shape[0], -np.inf)
+        self.eps = self._factor - 1.0
+        self._kwargs = kwargs
+        self._ball: tuple[np.ndarray, float] | None = None
+
+    def _solve(self) -> tuple[np.ndarray, float]:
+        """Compute the center and squared radius of the minimum enclosing ball of the core set."""
+        if self._ball is None:
+            center, r2, _ = _exact_support(self.points, **self._kwargs)
+            self._ball = (center, r2)
+        return self._ball
+
+    @property
+    def midpoint(self) -> np.ndarray | None:
+        """Get the center of the ball, None before the first update."""
+        return self._solve()[0] if self.count else None
+
+    @property
+    def lower(self) -> float:
+        """Get the radius of the minimum enclosing ball of the core set, a lower bound."""
+        return float(np.sqrt(self._solve()[1])) if self.count else 0.0
+
+    @property
+    def radius(self) -> float:
+        """Get a radius around midpoint that certifiably encloses all points seen so far."""
+        if not self.count:
+            return 0.0
+        _, r2 = _farthest_point(self.points, self.midpoint)
+        return float(np.sqrt(r2)) * self._factor
+
+    def update(self, chunk: np.ndarray) -> "CoresetBall":
+        """Add a chunk of points to the stream.
+
+        Args:
+            chunk: A numpy array of shape (m, d) with the new points.
+
+        Returns:
+            The updated ball itself.
+        """
+        chunk = np.atleast_2d(np.asarray(chunk, dtype=float))
+        if chunk.shape[0] == 0:
+            return self
+        self.count += chunk.shape[0]
+
+        # points within the extents along all directions around the mean of the core set are not extreme
+        if self.points.shape[0]:
+            center = self.points.mean(axis=0)
+            inner = float((self._extent - self._directions @ center).min())
+            u = chunk - center
+            chunk = chunk[np.einsum("ij,ij->i", u, u) > inner**2]
+
+        # keep the extreme points along each direction, in blocks of bounded memory
+        candidates = np.concatenate([self.points, chunk])
+        block = max(1, 2**22 // self._directions.shape[0])
+        best = np.full(self._directions.shape[0], -np.inf)
+        index = np.zeros(self._directions.shape[0], dtype=np.int64)
+        for start in range(0, candidates.shape[0], block):
+            values = candidates[start : start + block] @ self._directions.T
+            rows = np.argmax(values, axis=0)
+            top = values[rows, np.arange(values.shape[1])]
+            better = top > best
+            best[better], index[better] = top[better], rows[better] + start
+
+        self.points = candidates[np.unique(index)]
+        self._extent = best
+        self._ball = None
+        return self
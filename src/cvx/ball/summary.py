@@ -0,0 +1,181 @@
+"""Summary module for the CVX Ball package.
+
+This module provides mergeable summaries of point sets for sharded or
+map-reduce computations of the smallest enclosing ball. Every shard is reduced
+to a small core set, the summaries are merged, and a final verification pass
+over the shards makes the global ball exact.
+"""
+
+from collections.abc import Sequence
+from functools import reduce
+from typing import Any
+
+import numpy as np
+
+from .solver import _REL_TOL, _SOLVER_TOL, WELZL_MAX_DIM, _exact_support, min_circle_coreset
+
+
+def _cover(a: tuple[np.ndarray, float], b: tuple[np.ndarray, float]) -> tuple[np.ndarray, float]:
+    """Compute the smallest ball enclosing two balls.
+
+    Args:
+        a: The center and radius of the first ball.
+        b: The center and radius of the second ball.
+
+    Returns:
+        The center and radius of the enclosing ball.
+    """
+    (ca, ra), (cb, rb) = a, b
+    dist = float(np.linalg.norm(cb - ca))
+    if dist + rb <= ra:
+        return a
+    if dist + ra <= rb:
+        return b
+    radius = 0.5 * (dist + ra + rb)
+    return ca + (radius - ra) / dist * (cb - ca), radius
+
+
+class BallSummary:
+    """Mergeable summary of a set of points for the smallest enclosing ball.
+
+    A summary keeps a core set of the summarized points, O(1/eps) points for a
+    shard of any size, together with the minimum enclosing ball of the core set
+    and a ball certified to cover all summarized points.
+
+    The ball of a summary is a lower bound for the minimum enclosing ball of all
+    summarized points, and the ball around midpoint with radius bound encloses all
+    of them. Merging reduces the union of two core sets to a core set again, so
+    summaries can be combined in any order with bounded size. Shards can check
+    their points against a summary with violators, and refining the summary with
+    the violators until there are none makes the ball exact.
+
+    Attributes:
+        points: The core-set points of shape (k, d).
+        count: The number of summarized points.
+        eps: The accuracy of the core sets.
+    """
+
+    def __init__(self, points: np.ndarray, eps: float = 1e-2, compress: bool = True, **kwargs: dict[str, Any]) -> None:
+        """Summarize a set of points.
+
+        Args:
+            points: A numpy array of shape (n, d) with n >= 1.
+            eps: The accuracy of the core set: all points lie within (1 + eps)
+                times the radius of its ball.
+            compress: Whether to reduce the points to a core set, otherwise all
+                     points are kept.
+            **kwargs: Additional keyword arguments to pass to the CVXPY solver,
+                     used for dimensions above WELZL_MAX_DIM.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        self.count = points.shape[0]
+        if compress:
+            radius, center, core = min_circle_coreset(points, eps=eps, **kwargs)
+            points = points[np.sort(core)]
+        else:
+            center, r2, _ = _exact_support(points, **kwargs)
+            radius = float(np.sqrt(r2))
+
+        self.points = points
+        self.eps = eps
+        self._kwargs = kwargs
+        self._center = center
+        self._coverage = (center, radius)
+
+    @property
+    def midpoint(self) -> np.ndarray:
+        """Get the center of the minimum enclosing ball of the core set."""
+        return self._center
+
+    @property
+    def radius(self) -> float:
+        """Get the radius of the minimum enclosing ball of the core set, a lower bound."""
+        u = self.points - self._center
+        return float(np.sqrt(np.einsum("ij,ij->i", u, u).max()))
+
+    @property
+    def bound(self) -> float:
+        """Get a radius around midpoint that certifiably encloses all summarized points."""
+        center, radius = self._coverage
+        return max(self.radius, float(np.linalg.norm(self._center - center)) + radius)
+
+    def merge(self, other: "BallSummary") -> "BallSummary":
+        """Merge two summaries into a summary of the union of their points.
+
+        Args:
+            other: The summary to merge with.
+
+        Returns:
+            A new summary with a core set of the union of both core sets.
+        """
+        merged = BallSummary(np.concatenate([self.points, other.points]), eps=self.eps, **self._kwargs)
+        merged.count = self.count + other.count
+        merged._coverage = _cover(self._coverage, other._coverage)
+        return merged
+
+    def violators(self, points: np.ndarray, limit: int | None = None) -> np.ndarray:
+        """Find the points of a shard outside the ball of the summary.
+
+        Args:
+            points: A numpy array of shape (n, d) with the points of a shard.
+            limit: The maximal number of points to return, the farthest first.
+                  Defaults to d + 1.
+
+        Returns:
+            The violating points, an array of shape (m, d).
+        """
+        points = np.asarray(points, dtype=float)
+        d = points.shape[1]
+        tol = _REL_TOL if d <= WELZL_MAX_DIM else _SOLVER_TOL
+
+        u = points - self._center
+        dist = np.sqrt(np.einsum("ij,ij->i", u, u))
+        outside = np.flatnonzero(dist > self.radius * (1.0 + tol))
+        worst = outside[np.argsort(dist[outside])[::-1][: limit or d + 1]]
+        return points[worst]
+
+    def refine(self, violators: np.ndarray) -> "BallSummary":
+        """Add violating points to the summary without reducing it.
+
+        Args:
+            violators: Points outside the ball of the summary.
+
+        Returns:
+            A new summary whose ball also encloses the violators.
+        """
+        refined = BallSummary(np.concatenate([self.points, violators]), eps=self.eps, compress=False, **self._kwargs)
+        refined.count = self.count
+        refined._coverage = _cover(self._coverage, refined._coverage)
+        return refined
+
+
+def min_circle_sharded(
+    shards: Sequence[np.ndarray], eps: float = 1e-2, limit: int | None = None, **kwargs: dict[str, Any]
+) -> tuple[float, np.ndarray]:
+    """Compute the smallest enclosing ball of points split into shards.
+
+    This function runs the map-reduce scheme locally: every shard is summarized,
+    the summaries are merged, and verification passes over the shards add their
+    violators to the summary until all points lie inside the ball. Only core sets
+    and at most limit violators per shard and pass are moved between shards.
+
+    Args:
+        shards: A sequence of numpy arrays of shape (n_i, d).
+        eps: The accuracy of the core sets.
+        limit: The maximal number of violators per shard and pass.
+        **kwargs: Additional keyword arguments to pass to the CVXPY solver,
+                 used for dimensions above WELZL_MAX_DIM.
+
+    Returns:
+        A tuple containing:
+            - The radius of the smallest enclosing ball (float)
+            - The center point of the ball (numpy array of shape (d,))
+    """
+    summary = reduce(BallSummary.merge, [BallSummary(shard, eps=eps, **kwargs) for shard in shards])
+
+    while True:
+        violators = [summary.violators(shard, limit) for shard in shards]
+        violators = np.concatenate(violators)
+        if violators.shape[0] == 0:
+            return summary.radius, summary.midpoint
+        summary = summary.refine(violators)
@@ -0,0 +1,111 @@
+"""Window module for the CVX Ball package.
+
+This module maintains the exact minimum enclosing ball of the last W points of
+a stream. The points of the window are kept in a ring buffer, and the ball is
+only recomputed when the new point falls outside of it or a support point expires.
+"""
+
+import numpy as np
+
+from .solver import _REL_TOL, _pivot_welzl
+
+
+class SlidingWindowBall:
+    """Minimum enclosing ball of the last W points of a stream.
+
+    Every push overwrites the oldest point of the ring buffer with the new one.
+    The ball stays the same if the expired point is not a support point and the
+    new point lies inside the ball, which costs O(d). Otherwise the ball is
+    recomputed with the pivoting scheme of min_circle_welzl, warm started from
+    the remaining support points and the new point, which costs a few vectorized
+    passes over the window.
+
+    A point of a window in random order is a support point with probability at
+    most (d + 1) / W, so a push triggers a recomputation with probability
+    O(d / W) and the expected amortized cost per push does not grow with W.
+
+    This relies on the order of the points. If the stream drifts, e.g. a time
+    series with a trend, the oldest point of the window is almost always a
+    support point, and every push costs O(W * d) passes over the window: the
+    worst case is the cost of recomputing the ball from scratch, warm started.
+
+    Attributes:
+        window: The number of points in a full window.
+    """
+
+    def __init__(self, window: int) -> None:
+        """Initialize an empty window.
+
+        Args:
+            window: The number of points in a full window.
+
+        Raises:
+            ValueError: If the window is not positive.
+        """
+        if window <= 0:
+            raise ValueError("Window must contain at least one point")
+
+        self.window = window
+        self._buffer: np.ndarray | None = None
+        self._size = 0
+        self._head = 0
+        self._support: list[int] = []
+        self._center: np.ndarray | None = None
+        self._r2 = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of points in the window."""
+        return self._size
+
+    @property
+    def points(self) -> np.ndarray:
+        """Get the points of the window, in the order of the ring buffer."""
+        return self._buffer[: self._size]
+
+    @property
+    def radius(self) -> float:
+        """Get the radius of the minimum enclosing ball of the window."""
+        return float(np.sqrt(self._r2))
+
+    @property
+    def midpoint(self) -> np.ndarray | None:
+        """Get the center of the ball, None before the first push."""
+        return self._center
+
+    @property
+    def support(self) -> np.ndarray:
+        """Get the support points of the ball, an array of shape (k, d)."""
+        return self._buffer[self._support]
+
+    def push(self, point: np.ndarray) -> tuple[float, np.ndarray]:
+        """Add a point to the window, expiring the oldest one if the window is full.
+
+        Args:
+            point: A numpy array of shape (d,).
+
+        Returns:
+            A tuple containing:
+                - The radius of the smallest enclosing ball of the window (float)
+                - The center point of the ball (numpy array of shape (d,))
+        """
+        point = np.asarray(point, dtype=float)
+        if self._buffer is None:
+            self._buffer = np.zeros((self.window, point.size))
+
+        slot = self._head
+        expired = self._size == self.window and slot in self._support
+
+        self._buffer[slot] = point
+        self._head = (self._head + 1) % self.window
+        self._size = min(self._size + 1, self.window)
+
+        if not expired and self._center is not None:
+            u = point - self._center
+            if u @ u <= self._r2 * (1.0 + _REL_TOL):
+                # non-support point expired and the new point is inside
+                return self.radius, self._center
+
+        # warm start from the remaining support points and the new point
+        warm = [slot] + [j for j in self._support if j != slot]
+        self._center, self._r2, self._support = _pivot_welzl(self.points, support=warm)
+        return self.radius, self._center
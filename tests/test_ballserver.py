@@ -1,11 +1,19 @@
 """Tests for the BallServer class."""
 
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.flight as fl
 import pytest
+from flight.utils.alter import pa_2_np
 
-from cvx.ball.server import BallServer  # Adjust import path as needed
+from cvx.ball.server import BallServer, ResultCache  # Adjust import path as needed
+from cvx.ball.solver import min_circle_cvx, min_circle_welzl
 
 
 @pytest.fixture(scope="module")
@@ -110,3 +118,263 @@ def test_invalid_input_wrong_key(server: BallServer) -> None:
 
     with pytest.raises(KeyError):
         server.f({"wrong_key": points})
+
+
+def test_compute_ball_time_budget(server: BallServer) -> None:
+    """Test ball computation within a time budget given with the request.
+
+    Args:
+        server: The BallServer instance to test.
+
+    Verifies:
+        The response contains a lower bound below the radius, and the radius
+        encloses all points around the midpoint.
+    """
+    points: np.ndarray = np.random.default_rng(0).standard_normal((1000, 8))
+
+    np_dict: dict[str, Any] = server.f({"input": points, "time_budget": np.array(1.0)})
+
+    assert np_dict["lower"] <= np_dict["radius"]
+    assert np.linalg.norm(points - np_dict["midpoint"], axis=1).max() == pytest.approx(np_dict["radius"])
+
+
+def test_result_cache(server: BallServer, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that repeated requests are answered from the cache.
+
+    Args:
+        server: The BallServer instance to test.
+        monkeypatch: Fixture to count the calls of the solver.
+
+    Verifies:
+        Identical points are solved once, while different values, dtypes or
+        options are solved again, and the counters reflect hits and misses.
+    """
+    calls = []
+    solve = BallServer._solve
+    monkeypatch.setattr(BallServer, "_solve", staticmethod(lambda *args: calls.append(args) or solve(*args)))
+    server.cache.clear()
+
+    points: np.ndarray = np.random.default_rng(1).standard_normal((100, 3))
+    first = server.f({"input": points})
+    second = server.f({"input": points.copy()})
+
+    assert len(calls) == 1
+    assert second["radius"] == first["radius"]
+    assert (server.cache.hits, server.cache.misses) == (1, 1)
+
+    server.f({"input": points.astype(np.float32)})
+    server.f({"input": points + 1.0})
+    server.f({"input": points, "time_budget": np.array(1.0)})
+
+    assert len(calls) == 4
+    assert len(server.cache) == 4
+
+
+def test_result_cache_budget() -> None:
+    """Test the memory budget of the result cache.
+
+    Verifies:
+        The least recently used responses are evicted once the budget is
+        exceeded, and responses larger than the budget are not cached.
+    """
+    cache = ResultCache(max_bytes=2000)
+    results = {i: {"points": np.zeros(100) + i} for i in range(3)}
+    keys = {i: cache.key(results[i]["points"]) for i in range(3)}
+
+    cache.put(keys[0], results[0])
+    cache.put(keys[1], results[1])
+    assert cache.get(keys[0]) is results[0]
+
+    cache.put(keys[2], results[2])
+    assert len(cache) == 2
+    assert cache.nbytes == 1600
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is results[0]
+
+    cache.put(cache.key(np.zeros(1000)), {"points": np.zeros(1000)})
+    assert len(cache) == 2
+
+
+def test_compute_ball_lean(server: BallServer, expected_ball_square: dict[str, Any]) -> None:
+    """Test the lean response that leaves the points out.
+
+    Args:
+        server: The BallServer instance to test.
+        expected_ball_square: The expected results for the square points.
+
+    Verifies:
+        The response contains the ball and all four corners as support points,
+        but not the points themselves.
+    """
+    points = expected_ball_square["points"]
+
+    np_dict: dict[str, Any] = server.f({"input": points, "lean": np.array(True)})
+
+    assert "points" not in np_dict
+    np.testing.assert_allclose(np_dict["radius"], expected_ball_square["radius"], rtol=1e-5)
+    np.testing.assert_allclose(np_dict["midpoint"], expected_ball_square["midpoint"], rtol=1e-5)
+    assert np_dict["support"].tolist() == [0, 1, 2, 3]
+    np.testing.assert_array_equal(np_dict["support_points"], points)
+
+
+def test_compute_ball_lean_offset(server: BallServer) -> None:
+    """Test the lean response above WELZL_MAX_DIM for points far from the origin.
+
+    Args:
+        server: The BallServer instance to test.
+
+    Verifies:
+        All points on the sphere are reported as support points.
+    """
+    rng = np.random.default_rng(22)
+    g: np.ndarray = rng.standard_normal((3000, 8))
+    points = g / np.linalg.norm(g, axis=1, keepdims=True) + 1e5
+
+    np_dict: dict[str, Any] = server.f({"input": points, "lean": np.array(True)})
+
+    assert np_dict["support"].size == 3000
+    np.testing.assert_array_equal(np_dict["support_points"], points)
+
+
+def test_backpressure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the server rejects solves beyond its queue and stays healthy.
+
+    Args:
+        monkeypatch: Fixture to block the solver.
+
+    Verifies:
+        While the only worker is busy and the queue is full, further requests are
+        rejected with FlightUnavailableError, the health action answers over
+        Flight, and the blocked request completes once the solver is released.
+    """
+    release = threading.Event()
+    solve = BallServer._solve
+    monkeypatch.setattr(BallServer, "_solve", staticmethod(lambda *args: release.wait() and solve(*args)))
+
+    server = BallServer(host="localhost", port=5009, workers=1, queue_size=0)
+    points: np.ndarray = np.random.default_rng(2).standard_normal((100, 2))
+    try:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            blocked = pool.submit(server.f, {"input": points})
+            while server.health()["pending"] == 0:
+                time.sleep(0.01)
+
+            with pytest.raises(fl.FlightUnavailableError):
+                server.f({"input": points + 1.0})
+
+            with fl.connect("grpc://localhost:5009") as client:
+                health = json.loads(next(client.do_action(fl.Action("health", b""))).body.to_pybytes())
+            assert health == {
+                "status": "ok",
+                "workers": 1,
+                "pending": 1,
+                "capacity": 1,
+                "rejected": 1,
+                "cache": {"entries": 0, "hits": 0, "misses": 2},
+            }
+
+            release.set()
+            assert blocked.result()["radius"] == pytest.approx(min_circle_welzl(points)[0])
+            assert server.health()["pending"] == 0
+    finally:
+        release.set()
+        server.shutdown()
+
+
+def test_process_pool() -> None:
+    """Test solving in worker processes.
+
+    Verifies:
+        The workers are spawned rather than forked, and the response matches the
+        solution computed in the server process.
+    """
+    server = BallServer(host="localhost", port=5010, workers=2, processes=True)
+    points: np.ndarray = np.random.default_rng(3).standard_normal((500, 8))
+    try:
+        np_dict: dict[str, Any] = server.f({"input": points})
+        assert server._pool._mp_context.get_start_method() == "spawn"
+    finally:
+        server.shutdown()
+
+    assert np_dict["radius"] == pytest.approx(min_circle_cvx(points, solver="CLARABEL")[0], rel=1e-6)
+
+
+def test_batch_command() -> None:
+    """Test the batch command with a stream of record batches over Flight.
+
+    Verifies:
+        Groups in arbitrary row order are answered with one row per group in
+        sorted group order, matching the ball of each group, and a table without
+        group column is rejected.
+    """
+    rng = np.random.default_rng(4)
+    points: np.ndarray = rng.standard_normal((300, 2))
+    groups = rng.choice(np.array([7, 3, 11]), size=300)
+    table = pa.table({"group": groups, "x": points[:, 0], "y": points[:, 1]})
+
+    server = BallServer(host="localhost", port=5011)
+    try:
+        with fl.connect("grpc://localhost:5011") as client:
+            writer, _ = client.do_put(fl.FlightDescriptor.for_command(b"batch/test"), table.schema)
+            for batch in table.to_batches(max_chunksize=64):
+                writer.write_batch(batch)
+            writer.close()
+            result = client.do_get(fl.Ticket(b"batch/test")).read_all()
+
+            writer, _ = client.do_put(fl.FlightDescriptor.for_command(b"batch"), table.drop(["group"]).schema)
+            writer.write_table(table.drop(["group"]))
+            writer.close()
+            with pytest.raises(pa.ArrowInvalid, match="no group column"):
+                client.do_get(fl.Ticket(b"batch")).read_all()
+    finally:
+        server.shutdown()
+
+    assert result.column_names == ["group", "radius", "x", "y"]
+    assert result.column("group").to_pylist() == [3, 7, 11]
+    for row, group in enumerate([3, 7, 11]):
+        radius, center = min_circle_welzl(points[groups == group])
+        assert result.column("radius")[row].as_py() == pytest.approx(radius)
+        assert [result.column("x")[row].as_py(), result.column("y")[row].as_py()] == pytest.approx(center)
+
+
+def test_stream_command() -> None:
+    """Test the stream command with record batches solved while they arrive.
+
+    Verifies:
+        The response counts all points, all points lie within the radius of the
+        midpoint, the lower bound is below the optimum and the reported accuracy
+        relates both. In low dimensions it meets stream_eps. An empty upload is
+        rejected.
+    """
+    rng = np.random.default_rng(5)
+    points: np.ndarray = rng.standard_normal((5000, 3))
+    table = pa.table({"x": points[:, 0], "y": points[:, 1], "z": points[:, 2]})
+    wide: np.ndarray = rng.standard_normal((2000, 8))
+    wide_table = pa.table({f"x{j}": wide[:, j] for j in range(8)})
+
+    server = BallServer(host="localhost", port=5012)
+    try:
+        with fl.connect("grpc://localhost:5012") as client:
+            results = []
+            for name, data in ((b"stream/test", table), (b"stream/wide", wide_table)):
+                writer, _ = client.do_put(fl.FlightDescriptor.for_command(name), data.schema)
+                for batch in data.to_batches(max_chunksize=500):
+                    writer.write_batch(batch)
+                writer.close()
+                results.append(pa_2_np(client.do_get(fl.Ticket(name)).read_all()))
+
+            writer, _ = client.do_put(fl.FlightDescriptor.for_command(b"stream"), table.schema)
+            with pytest.raises(pa.ArrowInvalid, match="no values"):
+                writer.close()
+    finally:
+        server.shutdown()
+
+    for result, p in zip(results, (points, wide), strict=True):
+        radius = min_circle_cvx(p, solver="CLARABEL")[0]
+        assert result["count"] == p.shape[0]
+        assert np.linalg.norm(p - result["midpoint"], axis=1).max() <= result["radius"] * (1 + 1e-9)
+        assert result["lower"] <= radius * (1 + 1e-6)
+        assert result["radius"] == pytest.approx(result["lower"] * (1 + result["eps"]))
+
+    assert results[0]["eps"] <= server.stream_eps
+    assert results[0]["radius"] <= min_circle_welzl(points)[0] * (1 + server.stream_eps)
@@ -0,0 +1,86 @@
+"""Tests for the batch module.
+
+This module tests the min_circle_batch function from the cvx.ball.batch module,
+which computes the smallest enclosing balls of many groups of points at once.
+"""
+
+import numpy as np
+import pytest
+
+from cvx.ball.batch import min_circle_batch
+from cvx.ball.solver import min_circle_clarabel, min_circle_welzl
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3, 5])
+def test_batch_matches_single(dim: int) -> None:
+    """Test the batch solver against solving each group separately.
+
+    Args:
+        dim: The dimension of the random points.
+
+    Verifies:
+        The radii and centers agree with min_circle_welzl for every group,
+        including a group of identical points and a group of collinear points.
+    """
+    rng = np.random.default_rng(dim)
+    sizes: np.ndarray = rng.integers(1, 30, size=200)
+    offsets: np.ndarray = np.concatenate([[0], np.cumsum(sizes)])
+    p: np.ndarray = rng.standard_normal((offsets[-1], dim))
+    p[offsets[3] : offsets[4]] = p[offsets[3]]
+    p[offsets[5] : offsets[6]] = np.outer(rng.random(sizes[5]), np.ones(dim))
+
+    radii, centers = min_circle_batch(p, offsets)
+
+    for g in range(sizes.size):
+        radius, center = min_circle_welzl(p[offsets[g] : offsets[g + 1]])
+        assert radii[g] == pytest.approx(radius, rel=1e-9, abs=1e-12)
+        assert centers[g] == pytest.approx(center, abs=1e-8)
+
+
+def test_batch_high_dimension() -> None:
+    """Test the batch solver for dimensions solved group by group.
+
+    Verifies:
+        The results agree with min_circle_clarabel.
+    """
+    rng = np.random.default_rng(0)
+    offsets: np.ndarray = np.array([0, 10, 25, 40])
+    p: np.ndarray = rng.standard_normal((40, 8))
+
+    radii, centers = min_circle_batch(p, offsets)
+
+    for g in range(3):
+        radius, center = min_circle_clarabel(p[offsets[g] : offsets[g + 1]])
+        assert radii[g] == pytest.approx(radius)
+        assert centers[g] == pytest.approx(center)
+
+
+def test_batch_empty_group() -> None:
+    """Test handling of offsets with an empty group.
+
+    Verifies:
+        A ValueError is raised for empty groups and for offsets not matching the points.
+    """
+    p: np.ndarray = np.zeros((4, 2))
+
+    with pytest.raises(ValueError):
+        min_circle_batch(p, np.array([0, 2, 2, 4]))
+
+    with pytest.raises(ValueError):
+        min_circle_batch(p, np.array([0, 2, 3]))
+
+
+@pytest.mark.parametrize("dim", [2, 8])
+def test_batch_no_groups(dim: int) -> None:
+    """Test a batch without groups.
+
+    Args:
+        dim: The dimension of the points.
+
+    Verifies:
+        Empty arrays of radii and centers are returned.
+    """
+    radii, centers = min_circle_batch(np.zeros((0, dim)), np.array([0]))
+
+    assert radii.shape == (0,)
+    assert centers.shape == (0, dim)
@@ -0,0 +1,117 @@
+"""Tests for the chunked module.
+
+This module tests the min_circle_chunked function from the cvx.ball.chunked
+module, which computes the smallest enclosing ball out of core.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from cvx.ball.chunked import _ArrowPoints, min_circle_chunked
+from cvx.ball.solver import min_circle_welzl
+
+
+@pytest.fixture
+def points() -> np.ndarray:
+    """Fixture providing random 3D points.
+
+    Returns:
+        np.ndarray: An array of shape (10000, 3).
+    """
+    return np.random.default_rng(8).standard_normal((10000, 3))
+
+
+def test_chunked_npy(points: np.ndarray, tmp_path: Path) -> None:
+    """Test solving from a memory-mapped .npy file.
+
+    Args:
+        points: The random points.
+        tmp_path: A temporary directory.
+
+    Verifies:
+        The ball matches the in-memory solver, from a path and from a np.memmap.
+    """
+    path = tmp_path / "points.npy"
+    np.save(path, points)
+    radius, center = min_circle_welzl(points)
+
+    for source in (path, np.load(path, mmap_mode="r")):
+        r, c = min_circle_chunked(source, chunk_size=999)
+        assert r == pytest.approx(radius)
+        assert c == pytest.approx(center)
+
+
+def test_chunked_arrow(points: np.ndarray, tmp_path: Path) -> None:
+    """Test solving from an Arrow IPC file with several record batches.
+
+    Args:
+        points: The random points.
+        tmp_path: A temporary directory.
+
+    Verifies:
+        The ball matches the in-memory solver and encloses all points.
+    """
+    path = tmp_path / "points.arrow"
+    table = pa.table({f"x{j}": points[:, j] for j in range(3)})
+    with pa.ipc.new_file(str(path), table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=1500):
+            writer.write_batch(batch)
+
+    r, c = min_circle_chunked(path, chunk_size=1000)
+    radius, _ = min_circle_welzl(points)
+
+    assert r == pytest.approx(radius)
+    assert np.linalg.norm(points - c, axis=1).max() <= r * (1 + 1e-12)
+
+
+def test_chunked_arrow_single_batch(points: np.ndarray, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test chunked reads from an Arrow IPC file with a single record batch.
+
+    Args:
+        points: The random points.
+        tmp_path: A temporary directory.
+        monkeypatch: Fixture to spy on the batch conversions.
+
+    Verifies:
+        Slices return the requested rows and convert only those rows, and the ball
+        matches the in-memory solver.
+    """
+    path = tmp_path / "points.arrow"
+    table = pa.table({f"x{j}": points[:, j] for j in range(3)})
+    with pa.ipc.new_file(str(path), table.schema) as writer:
+        writer.write_table(table)
+
+    converted = []
+    batch = _ArrowPoints._batch
+
+    def spy(self: _ArrowPoints, i: int, offset: int = 0, length: int | None = None) -> np.ndarray:
+        rows = batch(self, i, offset, length)
+        converted.append(rows.shape[0])
+        return rows
+
+    monkeypatch.setattr(_ArrowPoints, "_batch", spy)
+    view = _ArrowPoints(path)
+
+    assert view[2000:3000] == pytest.approx(points[2000:3000])
+    assert view[9500:] == pytest.approx(points[9500:])
+    assert converted == [1000, 500]
+
+    r, c = min_circle_chunked(path, chunk_size=1000)
+    assert r == pytest.approx(min_circle_welzl(points)[0])
+    assert max(converted) <= 1000
+
+
+def test_chunked_unsupported(tmp_path: Path) -> None:
+    """Test handling of an unsupported file type.
+
+    Args:
+        tmp_path: A temporary directory.
+
+    Verifies:
+        A ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        min_circle_chunked(tmp_path / "points.csv")
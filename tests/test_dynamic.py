@@ -0,0 +1,74 @@
+"""Tests for the dynamic module.
+
+This module tests the DynamicBall class from the cvx.ball.dynamic module,
+which maintains the minimum enclosing ball of a set of points with insertions
+and deletions.
+"""
+
+import numpy as np
+import pytest
+
+from cvx.ball.dynamic import DynamicBall
+from cvx.ball.solver import min_circle_welzl
+
+
+def test_dynamic_matches_recomputation() -> None:
+    """Test a mixed stream of insertions and deletions against recomputation.
+
+    Verifies:
+        After every operation the ball equals the minimum enclosing ball of the
+        current points, and the structure holds exactly the current points.
+    """
+    rng = np.random.default_rng(5)
+    ball = DynamicBall()
+    live: dict[int, np.ndarray] = {}
+
+    for step in range(800):
+        if live and rng.random() < 0.45:
+            handle = list(live)[rng.integers(len(live))]
+            ball.delete(handle)
+            del live[handle]
+        else:
+            point: np.ndarray = rng.standard_normal(3) * (1 + step / 200)
+            live[ball.insert(point)] = point
+
+        assert len(ball) == len(live)
+        if not live:
+            assert ball.midpoint is None
+            continue
+
+        points = np.array(list(live.values()))
+        radius, center = min_circle_welzl(points)
+
+        assert sorted(map(tuple, ball.points)) == sorted(map(tuple, points))
+        assert ball.radius == pytest.approx(radius, rel=1e-9)
+        assert ball.midpoint == pytest.approx(center, abs=1e-8)
+
+
+def test_dynamic_empty() -> None:
+    """Test deleting all points and unknown handles.
+
+    Verifies:
+        The ball is reset when the last point is deleted, points can be inserted
+        again, and deleting an unknown handle raises a KeyError.
+    """
+    ball = DynamicBall()
+    a = ball.insert(np.array([0.0, 0.0]))
+    b = ball.insert(np.array([2.0, 0.0]))
+    assert ball.radius == pytest.approx(1.0)
+
+    ball.delete(a)
+    assert ball.radius == pytest.approx(0.0)
+    assert ball.midpoint == pytest.approx([2.0, 0.0])
+
+    ball.delete(b)
+    assert len(ball) == 0
+    assert ball.midpoint is None
+    assert a not in ball
+
+    with pytest.raises(KeyError):
+        ball.delete(a)
+
+    c = ball.insert(np.array([1.0, 1.0]))
+    assert c in ball
+    assert ball.midpoint == pytest.approx([1.0, 1.0])
@@ -0,0 +1,71 @@
+"""Tests for the parallel module.
+
+This module tests the min_circle_parallel function from the cvx.ball.parallel
+module, which spreads many enclosing ball problems across a process pool.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+import pytest
+
+from cvx.ball import parallel
+from cvx.ball.batch import min_circle_batch
+from cvx.ball.parallel import _partition, min_circle_parallel
+
+
+def test_parallel_matches_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the process pool against the serial batch solver.
+
+    Args:
+        monkeypatch: Fixture to record the start method of the pool.
+
+    Verifies:
+        The workers are spawned rather than forked, and the results of all groups
+        agree and are returned in input order.
+    """
+    methods = []
+    executor = parallel.ProcessPoolExecutor
+
+    def spy(*args: Any, **kwargs: Any) -> ProcessPoolExecutor:
+        methods.append(kwargs["mp_context"].get_start_method())
+        return executor(*args, **kwargs)
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", spy)
+    rng = np.random.default_rng(5)
+    sizes: np.ndarray = rng.integers(1, 50, size=300)
+    offsets: np.ndarray = np.concatenate([[0], np.cumsum(sizes)])
+    p: np.ndarray = rng.standard_normal((offsets[-1], 3))
+
+    radii, centers = min_circle_parallel(p, offsets, workers=2)
+    radii_batch, centers_batch = min_circle_batch(p, offsets)
+
+    assert methods == ["spawn"]
+    np.testing.assert_allclose(radii, radii_batch)
+    np.testing.assert_allclose(centers, centers_batch)
+
+
+def test_partition() -> None:
+    """Test the split of the groups into ranges.
+
+    Verifies:
+        The ranges cover all groups contiguously, also with more ranges than groups.
+    """
+    offsets: np.ndarray = np.array([0, 1, 100, 102, 110])
+
+    for n_tasks in (1, 3, 10):
+        tasks = _partition(offsets, n_tasks)
+        assert tasks[0][0] == 0
+        assert tasks[-1][-1] == 110
+        assert np.concatenate([task[:-1] for task in tasks]).tolist() == offsets[:-1].tolist()
+
+
+def test_parallel_empty_group() -> None:
+    """Test handling of offsets with an empty group.
+
+    Verifies:
+        A ValueError is raised before any worker is started.
+    """
+    with pytest.raises(ValueError):
+        min_circle_parallel(np.zeros((4, 2)), np.array([0, 2, 2, 4]), workers=2)
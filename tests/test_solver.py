@@ -1,14 +1,32 @@
 """Tests for the solver module.
 
-This module tests the functionality of the min_circle_cvx function from the
-cvx.ball.solver module, which computes the smallest enclosing ball for a set
-of points using convex optimization.
+This module tests the functionality of the min_circle_cvx, min_circle_clarabel,
+min_circle_welzl and min_circle_coreset functions from the cvx.ball.solver module,
+which compute the smallest enclosing ball for a set of points.
 """
 
+from typing import Any
+
+import cvxpy as cp
 import numpy as np
 import pytest
 
-from cvx.ball.solver import min_circle_cvx
+from cvx.ball import solver
+from cvx.ball.solver import (
+    ProblemCache,
+    SolveResult,
+    _closed_form,
+    compact_points,
+    min_ball_of_balls,
+    min_circle_anytime,
+    min_circle_certified,
+    min_circle_clarabel,
+    min_circle_coreset,
+    min_circle_cvx,
+    min_circle_welzl,
+    prefilter_points,
+    problem_cache,
+)
 
 
 def test_random() -> None:
@@ -30,3 +48,567 @@ def test_random() -> None:
     # Verify the results match the expected values
     assert radius == pytest.approx(2.2360679626271796, 1e-6)
     assert center == pytest.approx([1.0, 2.0], 1e-4)
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3, 5])
+def test_welzl_matches_cvx(dim: int) -> None:
+    """Test the combinatorial solver against the conic formulation.
+
+    Args:
+        dim: The dimension of the random points.
+
+    Verifies:
+        Both solvers agree on radius and center, and all points lie inside the ball.
+    """
+    rng = np.random.default_rng(dim)
+    p: np.ndarray = rng.standard_normal((500, dim))
+
+    radius, center = min_circle_welzl(p)
+    radius_cvx, center_cvx = min_circle_cvx(p, solver="CLARABEL")
+
+    assert radius == pytest.approx(radius_cvx, 1e-6)
+    assert center == pytest.approx(center_cvx, abs=1e-4)
+    assert np.linalg.norm(p - center, axis=1).max() <= radius * (1 + 1e-9)
+
+
+def test_welzl_degenerate() -> None:
+    """Test the combinatorial solver on duplicate and collinear points.
+
+    Verifies:
+        Degenerate inputs produce the ball spanned by the two extreme points.
+    """
+    p: np.ndarray = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [1.0, 1.0], [0.0, 0.0]])
+
+    radius, center = min_circle_welzl(p)
+
+    assert radius == pytest.approx(1.5 * np.sqrt(2.0))
+    assert center == pytest.approx([1.5, 1.5])
+
+    radius, center = min_circle_welzl(np.ones((10, 3)))
+
+    assert radius == 0.0
+    assert center == pytest.approx([1.0, 1.0, 1.0])
+
+
+@pytest.mark.parametrize("exact", [True, False])
+def test_coreset_guarantee(exact: bool) -> None:
+    """Test the core-set solver against the exact radius.
+
+    Args:
+        exact: Whether the core set is solved exactly.
+
+    Verifies:
+        The returned ball encloses all points, its radius is within (1 + eps)
+        of the optimum and the core-set indices refer to input points.
+    """
+    rng = np.random.default_rng(42)
+    p: np.ndarray = rng.random((20000, 5))
+    eps = 0.05
+
+    radius, center, core = min_circle_coreset(p, eps=eps, exact=exact)
+    optimal, _ = min_circle_welzl(p)
+
+    assert optimal * (1 - 1e-9) <= radius <= (1 + eps) * optimal
+    assert np.linalg.norm(p - center, axis=1).max() <= radius * (1 + 1e-9)
+    assert core.max() < p.shape[0]
+
+
+def test_coreset_early_stop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the solver-free core-set iteration with a small eps.
+
+    Args:
+        monkeypatch: Fixture to count the passes over the points.
+
+    Verifies:
+        The iteration stops long before ceil(1/eps^2) passes with a radius
+        within (1 + eps) of the optimum, and eps = 0 is rejected.
+    """
+    passes = []
+    farthest = solver._farthest_point
+
+    def spy(*args: Any, **kwargs: Any) -> tuple[int, float]:
+        passes.append(1)
+        return farthest(*args, **kwargs)
+
+    monkeypatch.setattr(solver, "_farthest_point", spy)
+    p: np.ndarray = np.random.default_rng(9).standard_normal((20000, 5))
+
+    radius, center, _ = min_circle_coreset(p, eps=1e-3, exact=False)
+    optimal, _ = min_circle_welzl(p)
+
+    assert len(passes) < 10000
+    assert optimal * (1 - 1e-9) <= radius <= (1 + 1e-3) * optimal
+    assert np.linalg.norm(p - center, axis=1).max() <= radius * (1 + 1e-9)
+
+    with pytest.raises(ValueError, match="positive"):
+        min_circle_coreset(p, eps=0.0, exact=False)
+
+
+def test_coreset_high_dimension() -> None:
+    """Test the core-set solver with conic core-set solves in higher dimension.
+
+    Verifies:
+        The radius is within (1 + eps) of the full conic formulation.
+    """
+    rng = np.random.default_rng(7)
+    p: np.ndarray = rng.standard_normal((2000, 8))
+
+    radius, _, core = min_circle_coreset(p, eps=1e-2, solver="CLARABEL")
+    optimal, _ = min_circle_cvx(p, solver="CLARABEL")
+
+    assert optimal * (1 - 1e-6) <= radius <= (1 + 1e-2) * optimal
+    assert len(core) < p.shape[0]
+
+
+def test_active_set_matches_full() -> None:
+    """Test the active-set mode against the full conic formulation.
+
+    Verifies:
+        Both formulations agree on the radius and center within the solver tolerance.
+    """
+    rng = np.random.default_rng(3)
+    p: np.ndarray = rng.standard_normal((5000, 4))
+
+    radius, center = min_circle_cvx(p, active_set=True, solver="CLARABEL")
+    radius_full, center_full = min_circle_cvx(p, solver="CLARABEL")
+
+    assert radius == pytest.approx(radius_full, 1e-6)
+    assert center == pytest.approx(center_full, abs=1e-3)
+
+
+def test_active_set_small_scale() -> None:
+    """Test the active-set mode on points of tiny scale.
+
+    Verifies:
+        The result is the scaled result for points of unit scale and encloses all points.
+    """
+    rng = np.random.default_rng(3)
+    p: np.ndarray = rng.standard_normal((5000, 4))
+
+    radius, center = min_circle_cvx(1e-6 * p, active_set=True, solver="CLARABEL")
+    radius_unit, center_unit = min_circle_cvx(p, active_set=True, solver="CLARABEL")
+
+    assert radius == pytest.approx(1e-6 * radius_unit, 1e-6)
+    assert center == pytest.approx(1e-6 * center_unit, abs=1e-12)
+    assert np.linalg.norm(1e-6 * p - center, axis=1).max() <= radius * (1 + 1e-6)
+
+
+def test_cached_problem() -> None:
+    """Test repeated solves with the parameterized problem cache.
+
+    Verifies:
+        Cached solves agree with uncached ones, problems are reused per shape
+        and the least recently used shape is evicted beyond the size bound.
+    """
+    rng = np.random.default_rng(11)
+    problem_cache.clear()
+
+    for _ in range(3):
+        p: np.ndarray = rng.standard_normal((50, 3))
+        radius, center = min_circle_cvx(p, cache=True, solver="CLARABEL")
+        radius_plain, center_plain = min_circle_cvx(p, solver="CLARABEL")
+
+        assert radius == pytest.approx(radius_plain, 1e-6)
+        assert center == pytest.approx(center_plain, abs=1e-4)
+
+    assert len(problem_cache) == 1
+
+    cache = ProblemCache(maxsize=2)
+    for n in (3, 4, 5):
+        cache.release((n, 2), cache.acquire((n, 2)))
+
+    assert len(cache) == 2
+    assert list(cache._problems) == [(4, 2), (5, 2)]
+
+
+@pytest.mark.parametrize("shape", [(3, 2), (1000, 3), (500, 12)])
+def test_clarabel_matches_cvx(shape: tuple[int, int]) -> None:
+    """Test the direct Clarabel backend against the CVXPY formulation.
+
+    Args:
+        shape: The shape (n, d) of the random points.
+
+    Verifies:
+        Both backends agree on the radius and center.
+    """
+    rng = np.random.default_rng(shape[0])
+    p: np.ndarray = rng.standard_normal(shape)
+
+    radius, center = min_circle_clarabel(p)
+    radius_cvx, center_cvx = min_circle_cvx(p, solver="CLARABEL")
+
+    assert radius == pytest.approx(radius_cvx, 1e-6)
+    assert center == pytest.approx(center_cvx, abs=1e-4)
+
+
+def test_clarabel_not_solved() -> None:
+    """Test the direct Clarabel backend when the solver stops early.
+
+    Verifies:
+        A SolverError is raised instead of returning the last iterate.
+    """
+    p: np.ndarray = np.random.default_rng(5).standard_normal((100, 3))
+
+    with pytest.raises(cp.error.SolverError, match="MaxIterations"):
+        min_circle_clarabel(p, max_iter=1)
+
+
+def test_ball_of_balls() -> None:
+    """Test the ball of balls against the full formulation and known cases.
+
+    Verifies:
+        The active-set mode agrees with the full formulation and encloses all balls,
+        balls with radius 0 give the ball of their centers, and a ball containing
+        all others is returned itself.
+    """
+    rng = np.random.default_rng(12)
+    centers: np.ndarray = rng.standard_normal((2000, 3))
+    radii: np.ndarray = rng.uniform(0.0, 0.5, size=2000)
+
+    radius, center = min_ball_of_balls(centers, radii, solver="CLARABEL")
+    radius_full, _ = min_ball_of_balls(centers, radii, active_set=False, solver="CLARABEL")
+
+    assert radius == pytest.approx(radius_full, 1e-6)
+    assert (np.linalg.norm(centers - center, axis=1) + radii).max() <= radius * (1 + 1e-6)
+
+    radius, _ = min_ball_of_balls(centers, np.zeros(2000), solver="CLARABEL")
+    assert radius == pytest.approx(min_circle_welzl(centers)[0], 1e-6)
+
+    radius, center = min_ball_of_balls(np.array([[0.0, 0.0], [0.5, 0.0]]), np.array([3.0, 1.0]))
+    assert radius == pytest.approx(3.0)
+    assert center == pytest.approx([0.0, 0.0], abs=1e-6)
+
+    with pytest.raises(ValueError, match="do not match"):
+        min_ball_of_balls(centers, radii[:-1])
+
+
+def test_ball_of_balls_small_scale() -> None:
+    """Test the ball of balls on balls of tiny scale.
+
+    Verifies:
+        The result is the scaled result for balls of unit scale and encloses all balls.
+    """
+    rng = np.random.default_rng(12)
+    centers: np.ndarray = rng.standard_normal((3000, 3))
+    radii: np.ndarray = rng.uniform(0.0, 0.5, size=3000)
+
+    radius, center = min_ball_of_balls(1e-6 * centers, 1e-6 * radii, solver="CLARABEL")
+    radius_unit, center_unit = min_ball_of_balls(centers, radii, solver="CLARABEL")
+
+    assert radius == pytest.approx(1e-6 * radius_unit, 1e-6)
+    assert center == pytest.approx(1e-6 * center_unit, abs=1e-12)
+    assert (np.linalg.norm(1e-6 * centers - center, axis=1) + 1e-6 * radii).max() <= radius * (1 + 1e-6)
+
+
+def test_affine_hull_reduction() -> None:
+    """Test problems with more dimensions than points.
+
+    Verifies:
+        Planar points embedded in 60 dimensions give the ball of the planar
+        points, mapped back to the embedding, with both conic backends.
+    """
+    rng = np.random.default_rng(13)
+    p: np.ndarray = rng.standard_normal((20, 2))
+    basis, _ = np.linalg.qr(rng.standard_normal((60, 2)))
+    offset: np.ndarray = rng.standard_normal(60)
+    embedded = p @ basis.T + offset
+
+    radius, center = min_circle_welzl(p)
+
+    for solve in (lambda q: min_circle_cvx(q, solver="CLARABEL"), min_circle_clarabel):
+        radius_embedded, center_embedded = solve(embedded)
+        assert radius_embedded == pytest.approx(radius, 1e-6)
+        assert center_embedded == pytest.approx(center @ basis.T + offset, abs=1e-4)
+
+
+@pytest.mark.parametrize(
+    ("points", "radius", "center"),
+    [
+        ([[1.0, 2.0, 3.0]], 0.0, [1.0, 2.0, 3.0]),
+        ([[1.0, 1.0], [1.0, 1.0], [1.0, 1.0]], 0.0, [1.0, 1.0]),
+        ([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0]], 1.0, [1.0, 0.0, 0.0]),
+        ([[0.0, 0.0], [3.0, 3.0], [1.0, 1.0], [-1.0, -1.0]], 2.0 * np.sqrt(2.0), [1.0, 1.0]),
+        ([[-1.0, 0.0], [1.0, 0.0], [0.0, 0.1]], 1.0, [0.0, 0.0]),
+        ([[-1.0, 0.0], [1.0, 0.0], [0.0, np.sqrt(3.0)]], 2.0 / np.sqrt(3.0), [0.0, 1.0 / np.sqrt(3.0)]),
+        (
+            [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]],
+            np.sqrt(2.0 / 3.0),
+            [1 / 3, 1 / 3, 1 / 3, 0],
+        ),
+    ],
+)
+def test_closed_form(points: list, radius: float, center: list) -> None:
+    """Test the closed-form solutions of trivial problems.
+
+    Args:
+        points: The points.
+        radius: The expected radius.
+        center: The expected center.
+
+    Verifies:
+        Single, identical, collinear points, an obtuse and an acute triangle and
+        a simplex in higher dimension are solved without a solver.
+    """
+    result = _closed_form(np.array(points))
+
+    assert result is not None
+    assert result[0] == pytest.approx(radius)
+    assert result[1] == pytest.approx(center, abs=1e-12)
+
+
+def test_closed_form_needs_solver() -> None:
+    """Test that general problems are left to the solver.
+
+    Verifies:
+        More than d + 1 points in general position are not solved in closed form.
+    """
+    p: np.ndarray = np.random.default_rng(14).standard_normal((10, 3))
+    assert _closed_form(p) is None
+
+
+@pytest.mark.parametrize("dim", [2, 3, 8])
+def test_prefilter_exact(dim: int) -> None:
+    """Test the interior-point screening.
+
+    Args:
+        dim: The dimension of the points.
+
+    Verifies:
+        Most points are discarded, the removed count is reported, and the ball of
+        the candidates equals the ball of all points.
+    """
+    rng = np.random.default_rng(dim)
+    p: np.ndarray = rng.standard_normal((5000, dim))
+    radius, _ = min_circle_cvx(p, solver="CLARABEL")
+
+    keep, removed = prefilter_points(p, solver="CLARABEL")
+
+    assert removed == 5000 - keep.size
+    assert removed > 2500
+    assert min_circle_cvx(p[keep], solver="CLARABEL")[0] == pytest.approx(radius, 1e-6)
+    assert min_circle_cvx(p, prefilter=True, solver="CLARABEL")[0] == pytest.approx(radius, 1e-6)
+
+    keep, removed = prefilter_points(p[:10])
+    assert keep.size == 10 and removed == 0
+
+
+def test_prefilter_sphere_offset() -> None:
+    """Test the interior-point screening on points on a sphere far from the origin.
+
+    Verifies:
+        No boundary point is discarded and prefiltering leaves the ball unchanged.
+    """
+    rng = np.random.default_rng(15)
+    g: np.ndarray = rng.standard_normal((5000, 12))
+    p = g / np.linalg.norm(g, axis=1, keepdims=True) + 1e3
+
+    keep, removed = prefilter_points(p, solver="CLARABEL")
+
+    assert keep.size == 5000 and removed == 0
+    radius, _ = min_circle_cvx(p, solver="CLARABEL")
+    assert min_circle_cvx(p, prefilter=True, solver="CLARABEL")[0] == pytest.approx(radius)
+
+
+def test_compact_points() -> None:
+    """Test the removal of exact and near duplicates.
+
+    Verifies:
+        Exact duplicates (including signed zeros) are removed, snapping to a grid
+        merges near duplicates, the radius changes within the stated bound, and
+        a tolerance whose grid cells overflow is rejected.
+    """
+    keep, removed = compact_points(np.array([[-0.0, 1.0], [0.0, 1.0], [0.0, 1.5], [0.0, 1.0]]))
+    assert keep.tolist() == [0, 2]
+    assert removed == 2
+
+    rng = np.random.default_rng(15)
+    base: np.ndarray = rng.standard_normal((500, 3))
+    p = base[rng.integers(0, 500, size=5000)] + rng.uniform(-1e-6, 1e-6, size=(5000, 3))
+
+    keep, removed = compact_points(p)
+    assert removed == 0
+
+    keep, removed = compact_points(p, tol=1e-3)
+    radius, _ = min_circle_welzl(p)
+    radius_compact, _ = min_circle_welzl(p[keep])
+
+    assert keep.size + removed == 5000
+    assert keep.size < 1000
+    assert radius_compact <= radius <= radius_compact + np.sqrt(3) * 1e-3
+    assert min_circle_cvx(p, compact=1e-3, solver="CLARABEL")[0] == pytest.approx(radius_compact, 1e-6)
+
+    with pytest.raises(ValueError, match="negative"):
+        compact_points(p, tol=-1.0)
+
+    with pytest.raises(ValueError, match="overflow"):
+        compact_points(np.array([[1e10, 0.0], [2e10, 0.0], [3e10, 0.0]]), tol=1e-9)
+
+
+@pytest.mark.parametrize("dim", [2, 3, 12])
+def test_certified_bounds(dim: int) -> None:
+    """Test the certified bounds of the tiered solve.
+
+    Args:
+        dim: The dimension of the points.
+
+    Verifies:
+        The bounds enclose the optimal radius, are tight and all points lie
+        within the upper bound of the center.
+    """
+    rng = np.random.default_rng(dim)
+    p: np.ndarray = rng.standard_normal((20000, dim))
+
+    lower, upper, center = min_circle_certified(p, chunk_size=1000, solver="CLARABEL")
+    radius = min_circle_welzl(p)[0] if dim <= 3 else min_circle_cvx(p, active_set=True, solver="CLARABEL")[0]
+
+    assert lower <= upper <= lower * (1 + 1e-6)
+    assert lower <= radius * (1 + 1e-6)
+    assert upper >= radius * (1 - 1e-6)
+    assert np.linalg.norm(p - center, axis=1).max() <= upper * (1 + 1e-12)
+
+
+def test_anytime_bounds() -> None:
+    """Test the anytime solver with an exhausted and with a generous budget.
+
+    Verifies:
+        Without budget, the bounds enclose the optimal radius after a single
+        iteration; with a generous budget the ball is exact.
+    """
+    rng = np.random.default_rng(16)
+    p: np.ndarray = rng.standard_normal((20000, 3))
+    radius, center = min_circle_welzl(p)
+
+    lower, upper, midpoint = min_circle_anytime(p, time_budget=0.0)
+    assert lower <= radius <= upper
+    assert np.linalg.norm(p - midpoint, axis=1).max() == pytest.approx(upper)
+
+    lower, upper, midpoint = min_circle_anytime(p, time_budget=60.0)
+    assert lower == pytest.approx(radius)
+    assert upper == pytest.approx(radius)
+    assert midpoint == pytest.approx(center)
+
+
+@pytest.mark.parametrize("d", [8, 12])
+def test_anytime_offset(d: int) -> None:
+    """Test the anytime solver above WELZL_MAX_DIM on points far from the origin.
+
+    Args:
+        d: The dimension of the points.
+
+    Verifies:
+        The support of the exact core-set solves is never empty and the bounds
+        enclose the radius of the sphere.
+    """
+    rng = np.random.default_rng(d)
+    g: np.ndarray = rng.standard_normal((5000, d))
+    p = g / np.linalg.norm(g, axis=1, keepdims=True) + 1e6
+
+    center, r2, support = solver._exact_support(p[:50], solver="CLARABEL")
+    assert support
+    assert np.linalg.norm(p[:50] - center, axis=1).max() ** 2 == pytest.approx(r2)
+
+    lower, upper, midpoint = min_circle_anytime(p, time_budget=60.0, solver="CLARABEL")
+    assert lower <= 1.0 + 1e-9
+    assert upper == pytest.approx(1.0, rel=1e-6)
+    assert np.linalg.norm(p - midpoint, axis=1).max() <= upper * (1 + 1e-12)
+
+
+def test_full_output() -> None:
+    """Test the structured result of min_circle_cvx.
+
+    Verifies:
+        The result unpacks like the tuple, carries status, iterations, timings,
+        support and violation, and reports the points removed by compaction and
+        prefiltering.
+    """
+    rng = np.random.default_rng(17)
+    p: np.ndarray = rng.standard_normal((2000, 3))
+    p = np.concatenate([p, p[:500]])
+
+    radius, center = min_circle_cvx(p, solver="CLARABEL")
+    result = min_circle_cvx(p, full_output=True, solver="CLARABEL")
+
+    assert isinstance(result, SolveResult)
+    assert result.status == "optimal"
+    assert result.objective == pytest.approx(radius)
+    assert result.iterations > 0
+    assert result.solves == 1
+    assert set(result.timings) == {"build", "canonicalize", "solve", "extract"}
+    assert all(t >= 0 for t in result.timings.values())
+    assert result.max_violation <= 1e-6
+    assert np.linalg.norm(p[result.support] - center, axis=1) == pytest.approx(radius, rel=1e-6)
+
+    r, x = result
+    assert r == pytest.approx(radius)
+    assert x == pytest.approx(center)
+
+    result = min_circle_cvx(p, compact=0.0, prefilter=True, full_output=True, solver="CLARABEL")
+    assert result.count == 2500
+    assert result.compacted == 500
+    assert result.compaction_ratio == pytest.approx(0.8)
+    assert result.prefiltered > 1000
+    assert result.radius == pytest.approx(radius, rel=1e-6)
+
+
+@pytest.mark.parametrize("loose", [1e-3, 1e-2])
+def test_certified_sphere(loose: float) -> None:
+    """Test the tiered solve on points on a sphere, where many points are near the boundary.
+
+    Args:
+        loose: The tolerances of the loose solves.
+
+    Verifies:
+        The solve terminates and the bounds enclose the radius of the sphere.
+    """
+    rng = np.random.default_rng(2)
+    g: np.ndarray = rng.standard_normal((20000, 3))
+    p = g / np.linalg.norm(g, axis=1, keepdims=True)
+
+    lower, upper, center = min_circle_certified(p, loose=loose)
+
+    assert lower <= min_circle_welzl(p)[0] * (1 + 1e-9)
+    assert upper <= lower * (1 + 1e-6)
+    assert np.linalg.norm(p - center, axis=1).max() <= upper * (1 + 1e-12)
+
+
+@pytest.mark.parametrize("d", [10, 20])
+def test_certified_sphere_high_dim(d: int) -> None:
+    """Test the lower bound of the tiered solve on points on a sphere above WELZL_MAX_DIM.
+
+    Args:
+        d: The dimension of the points.
+
+    Verifies:
+        The lower bound is within the tolerance of the radius of the sphere.
+    """
+    rng = np.random.default_rng(0)
+    g: np.ndarray = rng.standard_normal((20000, d))
+    p = g / np.linalg.norm(g, axis=1, keepdims=True)
+
+    lower, upper, center = min_circle_certified(p, solver="CLARABEL")
+
+    assert lower <= 1.0 + 1e-9
+    assert upper <= lower * (1 + 1e-6)
+    assert np.linalg.norm(p - center, axis=1).max() <= upper * (1 + 1e-12)
+
+
+@pytest.mark.parametrize(("d", "offset"), [(6, 1e3), (8, 1e6), (12, 1e6)])
+def test_certified_offset(d: int, offset: float) -> None:
+    """Test the tiered solve above WELZL_MAX_DIM on points on a sphere far from the origin.
+
+    Args:
+        d: The dimension of the points.
+        offset: The offset of the center of the sphere in every coordinate.
+
+    Verifies:
+        The bounds are within the tolerance of each other and of the radius of the sphere.
+    """
+    rng = np.random.default_rng(d)
+    g: np.ndarray = rng.standard_normal((5000, d))
+    p = g / np.linalg.norm(g, axis=1, keepdims=True) + offset
+
+    lower, upper, center = min_circle_certified(p, solver="CLARABEL")
+
+    assert lower <= 1.0 + 1e-9
+    assert upper <= lower * (1 + 1e-6)
+    assert np.linalg.norm(p - center, axis=1).max() <= upper * (1 + 1e-12)
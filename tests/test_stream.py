@@ -0,0 +1,139 @@
+"""Tests for the stream module.
+
+This module tests the EnclosingBall and CoresetBall classes from the
+cvx.ball.stream module, which maintain enclosing balls of an append-only
+stream of points.
+"""
+
+import numpy as np
+import pytest
+
+from cvx.ball.solver import min_circle_welzl
+from cvx.ball.stream import CoresetBall, EnclosingBall
+
+
+def test_stream_bounds() -> None:
+    """Test the ball of a random stream against the minimum enclosing ball of all points.
+
+    Verifies:
+        The ball encloses all points, its radius and lower bound bracket the
+        optimal radius and are within a factor 3/2.
+    """
+    rng = np.random.default_rng(1)
+    p: np.ndarray = rng.standard_normal((5000, 3))
+
+    ball = EnclosingBall()
+    for chunk in np.array_split(p, 50):
+        ball.update(chunk)
+
+    radius, _ = min_circle_welzl(p)
+
+    assert ball.count == 5000
+    assert np.linalg.norm(p - ball.midpoint, axis=1).max() <= ball.radius * (1 + 1e-9)
+    assert ball.lower <= radius * (1 + 1e-9)
+    assert ball.radius >= radius * (1 - 1e-9)
+    assert ball.radius <= 1.5 * ball.lower * (1 + 1e-9)
+    assert ball.support.shape[0] <= 4
+
+
+@pytest.mark.parametrize("walk", [False, True])
+def test_stream_drifting(walk: bool) -> None:
+    """Test streams whose points drift away from the first ball.
+
+    Args:
+        walk: Whether the points are a random walk instead of a drifting cloud.
+
+    Verifies:
+        At most max_uncovered previous balls are kept, the ball encloses all points
+        and its radius is within 3/2 of the lower bound after every update.
+    """
+    rng = np.random.default_rng(4)
+    if walk:
+        chunks = np.array_split(np.cumsum(rng.standard_normal((20000, 3)), axis=0), 200)
+    else:
+        chunks = [rng.standard_normal((50, 2)) + [0.05 * k, 0.0] for k in range(400)]
+
+    ball = EnclosingBall(max_uncovered=4)
+    for chunk in chunks:
+        ball.update(chunk)
+        assert len(ball._uncovered) <= 4
+        assert ball.radius <= 1.5 * ball.lower * (1 + 1e-9)
+
+    p = np.concatenate(chunks)
+    assert np.linalg.norm(p - ball.midpoint, axis=1).max() <= ball.radius * (1 + 1e-9)
+    assert ball.lower <= min_circle_welzl(p)[0] * (1 + 1e-9)
+
+
+def test_stream_growing() -> None:
+    """Test a stream whose balls contain all previous balls.
+
+    Verifies:
+        The ball is certified exact and equals the minimum enclosing ball of all points.
+    """
+    rng = np.random.default_rng(2)
+    chunks = [k * rng.standard_normal((100, 2)) for k in range(1, 6)]
+
+    ball = EnclosingBall()
+    for chunk in chunks:
+        ball.update(chunk)
+
+    radius, center = min_circle_welzl(np.concatenate(chunks))
+
+    assert ball.exact
+    assert ball.radius == pytest.approx(radius)
+    assert ball.midpoint == pytest.approx(center)
+
+
+def test_stream_skips_interior_points() -> None:
+    """Test an update with points inside the current ball.
+
+    Verifies:
+        The support set and the ball are left untouched.
+    """
+    ball = EnclosingBall().update(np.array([[-1.0, 0.0], [1.0, 0.0]]))
+    support = ball.support
+
+    ball.update(0.5 * np.random.default_rng(3).uniform(-1, 1, size=(100, 2)))
+
+    assert ball.support is support
+    assert ball.radius == pytest.approx(1.0)
+    assert ball.midpoint == pytest.approx([0.0, 0.0])
+    assert ball.exact
+
+
+@pytest.mark.parametrize("d", [1, 2, 3, 4])
+def test_coreset_ball(d: int) -> None:
+    """Test the core-set ball of a random stream against the minimum enclosing ball of all points.
+
+    Args:
+        d: The dimension of the points.
+
+    Verifies:
+        The ball encloses all points, its radius is within 1 + eps of the optimal
+        radius, the lower bound is below it and the core set is small.
+    """
+    rng = np.random.default_rng(d)
+    p: np.ndarray = rng.standard_normal((10000, d))
+
+    ball = CoresetBall(d, eps=1e-2)
+    for chunk in np.array_split(p, 20):
+        ball.update(chunk)
+
+    radius, _ = min_circle_welzl(p)
+
+    assert ball.count == 10000
+    assert ball.eps <= 1e-2
+    assert np.linalg.norm(p - ball.midpoint, axis=1).max() <= ball.radius * (1 + 1e-9)
+    assert ball.lower <= radius * (1 + 1e-9)
+    assert ball.radius <= radius * (1 + ball.eps) * (1 + 1e-9)
+    assert ball.points.shape[0] < 500
+
+
+def test_coreset_ball_dimension() -> None:
+    """Test the core-set ball in a dimension where the directions exceed the limit.
+
+    Verifies:
+        A ValueError is raised.
+    """
+    with pytest.raises(ValueError, match="directions"):
+        CoresetBall(10)
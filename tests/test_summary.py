@@ -0,0 +1,68 @@
+"""Tests for the summary module.
+
+This module tests the BallSummary class and the min_circle_sharded function from
+the cvx.ball.summary module, which compute enclosing balls of sharded point sets.
+"""
+
+from functools import reduce
+
+import numpy as np
+import pytest
+
+from cvx.ball.solver import min_circle_welzl
+from cvx.ball.summary import BallSummary, min_circle_sharded
+
+
+def test_summary_bounds() -> None:
+    """Test merged summaries of random shards against the minimum enclosing ball.
+
+    Verifies:
+        The merged summary is small, counts all points, its radius is a lower
+        bound for the optimum and all points lie within bound of the midpoint.
+    """
+    rng = np.random.default_rng(1)
+    p: np.ndarray = rng.standard_normal((20000, 3))
+    shards = np.array_split(p, 8)
+
+    summary = reduce(BallSummary.merge, [BallSummary(shard) for shard in shards])
+    radius, _ = min_circle_welzl(p)
+
+    assert summary.count == 20000
+    assert summary.points.shape[0] <= 200
+    assert summary.radius <= radius * (1 + 1e-9)
+    assert np.linalg.norm(p - summary.midpoint, axis=1).max() <= summary.bound * (1 + 1e-9)
+
+
+def test_summary_violators() -> None:
+    """Test the verification pass of a shard against a summary.
+
+    Verifies:
+        Only points outside the ball are returned, the farthest first, at most limit.
+    """
+    summary = BallSummary(np.array([[-1.0, 0.0], [1.0, 0.0]]))
+    shard = np.array([[0.0, 0.5], [3.0, 0.0], [0.0, 2.0], [0.0, -1.5]])
+
+    assert summary.violators(shard) == pytest.approx(np.array([[3.0, 0.0], [0.0, 2.0], [0.0, -1.5]]))
+    assert summary.violators(shard, limit=1) == pytest.approx(np.array([[3.0, 0.0]]))
+    assert summary.violators(shard[:1]).shape == (0, 2)
+
+
+@pytest.mark.parametrize("d", [2, 8])
+def test_sharded_exact(d: int) -> None:
+    """Test the sharded computation against the minimum enclosing ball of all points.
+
+    Args:
+        d: The dimension of the points.
+
+    Verifies:
+        The radius and center match the unsharded solution.
+    """
+    rng = np.random.default_rng(d)
+    p: np.ndarray = rng.standard_normal((5000, d))
+
+    radius, center = min_circle_sharded(np.array_split(p, 5), solver="CLARABEL")
+
+    assert radius == pytest.approx(np.linalg.norm(p - center, axis=1).max(), rel=1e-6)
+    if d == 2:
+        expected, _ = min_circle_welzl(p)
+        assert radius == pytest.approx(expected)
@@ -0,0 +1,48 @@
+"""Tests for the window module.
+
+This module tests the SlidingWindowBall class from the cvx.ball.window module,
+which maintains the minimum enclosing ball of the last W points of a stream.
+"""
+
+import numpy as np
+import pytest
+
+from cvx.ball.solver import min_circle_welzl
+from cvx.ball.window import SlidingWindowBall
+
+
+@pytest.mark.parametrize("drift", [False, True])
+def test_window_matches_recomputation(drift: bool) -> None:
+    """Test every push against recomputing the ball of the window.
+
+    Args:
+        drift: Whether the points follow a random walk, so support points expire often.
+
+    Verifies:
+        The reported ball equals the minimum enclosing ball of the last W points.
+    """
+    rng = np.random.default_rng(4)
+    stream: np.ndarray = rng.standard_normal((600, 3))
+    if drift:
+        stream = np.cumsum(stream, axis=0)
+
+    window = 50
+    ball = SlidingWindowBall(window)
+
+    for i, point in enumerate(stream):
+        radius, center = ball.push(point)
+        expected, expected_center = min_circle_welzl(stream[max(0, i - window + 1) : i + 1])
+
+        assert len(ball) == min(i + 1, window)
+        assert radius == pytest.approx(expected, rel=1e-9)
+        assert center == pytest.approx(expected_center, abs=1e-8)
+
+
+def test_window_invalid_size() -> None:
+    """Test handling of a window without points.
+
+    Verifies:
+        A ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        SlidingWindowBall(0)